@@ -3,6 +3,7 @@ Scraper CLI Entry Point
 
 Usage:
     python -m scraper search --city="Miami" --category="MASSAGE"
+    python -m scraper search-batch --spec jobs.json
     python -m scraper enrich --input providers.json [--playwright] [--llm]
     python -m scraper fetch --url="https://example.com"
     python -m scraper stats
@@ -12,17 +13,25 @@ import argparse
 import asyncio
 import sys
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
-from .config import get_settings
-from .schemas import ScrapedProvider, ScrapeRunStats, ServiceCategory
-from .sources import GooglePlacesSource, WebsiteSource
-from .normalizers import ProviderNormalizer, Deduplicator
-from .storage import JsonStore, TokenTracker
+import orjson
+
+from .config import get_settings, RateLimiter
+from .schemas import ScrapeRunStats, ServiceCategory
+from .sources import GooglePlacesSource, WebsiteSource, SourceResult
+from .normalizers import ProviderNormalizer, Deduplicator, category_from_value
+from .storage import JsonStore, NdjsonWriter, TokenTracker
+from .utils import get_shared_session, close_shared_session, runtime
 from .enrichers.website_enricher import WebsiteEnricher
 from .enrichers.hybrid_enricher import HybridEnricher
 
+# Valid --category values, computed once for every subcommand
+_CATEGORY_CHOICES = tuple(c.value for c in ServiceCategory)
+
 
 def create_parser() -> argparse.ArgumentParser:
     """Create CLI argument parser."""
@@ -31,7 +40,7 @@ def create_parser() -> argparse.ArgumentParser:
         description="OpenSlots Provider Scraper",
     )
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    subparsers = parser.add_subparsers(dest="command", required=True, help="Available commands")
 
     # Search command
     search_parser = subparsers.add_parser("search", help="Search for providers")
@@ -43,7 +52,7 @@ def create_parser() -> argparse.ArgumentParser:
     search_parser.add_argument(
         "--category",
         required=True,
-        choices=[c.value for c in ServiceCategory],
+        choices=_CATEGORY_CHOICES,
         help="Service category",
     )
     search_parser.add_argument(
@@ -57,6 +66,29 @@ def create_parser() -> argparse.ArgumentParser:
         help="Output file path (default: auto-generated)",
     )
 
+    # Search-batch command
+    batch_parser = subparsers.add_parser(
+        "search-batch",
+        help="Run many searches in one process with shared rate limits and dedup",
+    )
+    batch_parser.add_argument(
+        "--spec",
+        required=True,
+        help='JSON file listing jobs: [{"city": ..., "category": ..., "max_results": ...}, ...]',
+    )
+    batch_parser.add_argument(
+        "--max-results",
+        type=int,
+        default=20,
+        help="Default maximum results per job (default: 20)",
+    )
+    batch_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Jobs run in parallel (default: 4)",
+    )
+
     # Fetch command
     fetch_parser = subparsers.add_parser("fetch", help="Fetch a single provider URL")
     fetch_parser.add_argument(
@@ -97,103 +129,275 @@ def create_parser() -> argparse.ArgumentParser:
     enrich_parser.add_argument(
         "--category",
         default="MASSAGE",
-        choices=[c.value for c in ServiceCategory],
+        choices=_CATEGORY_CHOICES,
         help="Service category for cleanup rules (default: MASSAGE)",
     )
+    enrich_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Max providers enriched in parallel (default: settings.enrich_concurrency)",
+    )
+    enrich_parser.add_argument(
+        "--pretty",
+        action="store_true",
+        default=False,
+        help="Write indented JSON (default: compact)",
+    )
+    enrich_parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        default=False,
+        help="Re-scrape providers that already have services",
+    )
+    enrich_parser.add_argument(
+        "--format",
+        dest="output_format",
+        default="json",
+        choices=["json", "jsonl"],
+        help="json: one document; jsonl: one provider per line plus .meta.json (default: json)",
+    )
 
     return parser
 
 
+async def run_search(
+    city: str,
+    category: ServiceCategory,
+    max_results: int,
+    source: GooglePlacesSource,
+    store: JsonStore,
+    dedup: Deduplicator,
+    normalizer: ProviderNormalizer,
+    run_id: str,
+    prefix: str = "",
+) -> ScrapeRunStats:
+    """
+    Search one city/category and save its providers and run stats.
+
+    The deduplicator may be shared between concurrent searches; only the
+    providers this search found are saved to its output file.
+
+    Args:
+        city: City to search in
+        category: Service category
+        max_results: Maximum number of results
+        source: Search source (its rate limiter is shared across searches)
+        store: Output store
+        dedup: Deduplicator
+        normalizer: Provider normalizer
+        run_id: Run ID for the stats file
+        prefix: Prepended to progress lines (identifies the job in a batch)
+
+    Returns:
+        Stats for this search
+    """
+    stats = ScrapeRunStats(
+        run_id=run_id,
+        started_at=datetime.utcnow(),
+    )
+
+    # Index keys of providers found by this search, in first-seen order
+    found_keys: dict[str, None] = {}
+
+    # Fetching and processing run as separate tasks connected by a bounded
+    # queue, so the next network request is in flight while earlier results
+    # are normalized and deduplicated.
+    queue: asyncio.Queue[Optional[SourceResult]] = asyncio.Queue(maxsize=64)
+
+    async def produce() -> None:
+        try:
+            async for result in source.search(city, category, max_results=max_results):
+                await queue.put(result)
+        finally:
+            await queue.put(None)  # Sentinel: no more results
+
+    # Per-provider progress lines are buffered and written in chunks
+    # rather than one stdout write per line.
+    log: list[str] = []
+
+    def flush_log() -> None:
+        if log:
+            sys.stdout.write("\n".join(log) + "\n")
+            sys.stdout.flush()
+            log.clear()
+
+    async def consume(journal: NdjsonWriter) -> None:
+        # Processing is synchronous, so dedup state is never touched by two
+        # coroutines at once and needs no lock.
+        while (result := await queue.get()) is not None:
+            stats.pages_attempted += 1
+
+            if result.success and result.provider:
+                stats.pages_fetched += 1
+
+                # Normalize
+                provider = normalizer.normalize(result.provider)
+
+                # Check for duplicates
+                is_new, merged = dedup.add(provider)
+                key = dedup.key_for(merged)
+                if key:
+                    found_keys[key] = None
+
+                if is_new:
+                    stats.providers_new += 1
+                    journal.write(merged)
+                    log.append(f"{prefix}  Found: {merged.name}")
+                else:
+                    stats.duplicates_skipped += 1
+                    log.append(f"{prefix}  Merged: {merged.name}")
+
+                stats.providers_found += 1
+                stats.services_extracted += len(merged.services)
+
+            else:
+                stats.pages_errored += 1
+                if result.error:
+                    stats.errors.append({
+                        "url": result.source_url,
+                        "error": result.error,
+                    })
+                    log.append(f"{prefix}  Error: {result.error}")
+
+            if len(log) >= 50:
+                flush_log()
+
+        flush_log()
+
+    # New providers are streamed to NDJSON as they're found so a crashed
+    # run keeps its progress.
+    with store.open_ndjson(city, category.value) as journal:
+        print(f"{prefix}Streaming providers to {journal.path}")
+        await asyncio.gather(produce(), consume(journal))
+
+    # Save results
+    stats.completed_at = datetime.utcnow()
+
+    # The deduplicator holds the final (merged) version of every provider
+    providers = [dedup.get(key) for key in found_keys]
+    if providers:
+        path = store.save_providers(providers, city, category.value)
+        print(f"\n{prefix}Saved {len(providers)} providers to {path}")
+
+    store.save_run_stats(stats)
+    return stats
+
+
+def print_run_summary(stats: ScrapeRunStats) -> None:
+    """Print the end-of-run summary for one search."""
+    print(f"\n{'='*50}")
+    print(f"Run completed: {stats.run_id}")
+    print(f"  Pages attempted: {stats.pages_attempted}")
+    print(f"  Pages fetched: {stats.pages_fetched}")
+    print(f"  Providers found: {stats.providers_found}")
+    print(f"  New providers: {stats.providers_new}")
+    print(f"  Duplicates merged: {stats.duplicates_skipped}")
+    print(f"  Services extracted: {stats.services_extracted}")
+    print(f"  Errors: {stats.pages_errored}")
+
+
 async def cmd_search(args: argparse.Namespace) -> int:
     """Execute search command."""
     settings = get_settings()
-    store = JsonStore()
-    dedup = Deduplicator()
-    normalizer = ProviderNormalizer()
     token_tracker = TokenTracker()
 
     run_id = str(uuid.uuid4())[:8]
     token_tracker.set_task_id(run_id)
 
-    stats = ScrapeRunStats(
-        run_id=run_id,
-        started_at=datetime.utcnow(),
-    )
-
     print(f"Searching for {args.category} providers in {args.city}...")
     print(f"Run ID: {run_id}")
     print()
 
     # Use Google Places if available, otherwise just print info
     if settings.google_places_enabled:
-        source = GooglePlacesSource()
+        source = GooglePlacesSource(session=get_shared_session())
         print("Using Google Places API")
     else:
         print("Google Places API not configured (set GOOGLE_API_KEY)")
         print("Skipping search - would search with configured sources")
         return 0
 
-    providers: list[ScrapedProvider] = []
+    async with source:
+        stats = await run_search(
+            args.city,
+            category_from_value(args.category),
+            args.max_results,
+            source=source,
+            store=JsonStore(),
+            dedup=Deduplicator(),
+            normalizer=ProviderNormalizer(),
+            run_id=run_id,
+        )
+    token_tracker.flush()
 
-    async for result in source.search(args.city, args.category, max_results=args.max_results):
-        stats.pages_attempted += 1
+    print_run_summary(stats)
+    return 0
 
-        if result.success and result.provider:
-            stats.pages_fetched += 1
 
-            # Normalize
-            provider = normalizer.normalize(result.provider)
+async def cmd_search_batch(args: argparse.Namespace) -> int:
+    """Execute search-batch command - many searches sharing one process."""
+    settings = get_settings()
+    spec_path = Path(args.spec)
 
-            # Check for duplicates
-            is_new, merged = dedup.add(provider)
+    if not spec_path.exists():
+        print(f"Error: Spec file not found: {spec_path}")
+        return 1
 
-            if is_new:
-                stats.providers_new += 1
-                providers.append(merged)
-                print(f"  Found: {merged.name}")
-            else:
-                stats.duplicates_skipped += 1
-                print(f"  Merged: {merged.name}")
+    jobs = orjson.loads(spec_path.read_bytes())
+    for i, job in enumerate(jobs):
+        if not job.get("city") or job.get("category") not in _CATEGORY_CHOICES:
+            print(f"Error: Job {i} needs a city and one of {', '.join(_CATEGORY_CHOICES)}")
+            return 1
 
-            stats.providers_found += 1
-            stats.services_extracted += len(merged.services)
+    if not settings.google_places_enabled:
+        print("Google Places API not configured (set GOOGLE_API_KEY)")
+        return 0
 
-        else:
-            stats.pages_errored += 1
-            if result.error:
-                stats.errors.append({
-                    "url": result.source_url,
-                    "error": result.error,
-                })
-                print(f"  Error: {result.error}")
+    # One rate limiter, store, deduplicator and connection pool for every
+    # job, so API quotas are budgeted globally and providers found by
+    # overlapping searches are merged.
+    source = GooglePlacesSource(rate_limiter=RateLimiter(), session=get_shared_session())
+    store = JsonStore()
+    dedup = Deduplicator()
+    normalizer = ProviderNormalizer()
+    token_tracker = TokenTracker()
 
-    # Save results
-    stats.completed_at = datetime.utcnow()
+    batch_id = str(uuid.uuid4())[:8]
+    token_tracker.set_task_id(batch_id)
+    semaphore = asyncio.Semaphore(args.concurrency)
 
-    if providers:
-        path = store.save_providers(providers, args.city, args.category)
-        print(f"\nSaved {len(providers)} providers to {path}")
+    print(f"Running {len(jobs)} searches (batch {batch_id})...")
+    print()
 
-    store.save_run_stats(stats)
+    async def run_one(i: int, job: dict) -> ScrapeRunStats:
+        async with semaphore:
+            return await run_search(
+                job["city"],
+                category_from_value(job["category"]),
+                job.get("max_results", args.max_results),
+                source=source,
+                store=store,
+                dedup=dedup,
+                normalizer=normalizer,
+                run_id=f"{batch_id}-{i}",
+                prefix=f"[{job['city']}/{job['category']}] ",
+            )
+
+    async with source:
+        all_stats = await asyncio.gather(*(run_one(i, job) for i, job in enumerate(jobs)))
     token_tracker.flush()
 
-    # Print summary
-    print(f"\n{'='*50}")
-    print(f"Run completed: {run_id}")
-    print(f"  Pages attempted: {stats.pages_attempted}")
-    print(f"  Pages fetched: {stats.pages_fetched}")
-    print(f"  Providers found: {stats.providers_found}")
-    print(f"  New providers: {stats.providers_new}")
-    print(f"  Duplicates merged: {stats.duplicates_skipped}")
-    print(f"  Services extracted: {stats.services_extracted}")
-    print(f"  Errors: {stats.pages_errored}")
+    for stats in all_stats:
+        print_run_summary(stats)
+    print(f"\nUnique providers across batch: {dedup.count()}")
 
     return 0
 
 
 async def cmd_fetch(args: argparse.Namespace) -> int:
     """Execute fetch command."""
-    source = WebsiteSource()
+    source = WebsiteSource(session=get_shared_session())
 
     print(f"Fetching {args.url}...")
 
@@ -226,23 +430,36 @@ async def cmd_enrich(args: argparse.Namespace) -> int:
     print(f"  Category: {category}")
     print()
 
-    if args.playwright:
-        # Use hybrid enricher with Playwright for booking systems
-        async with HybridEnricher(headless=True) as enricher:
+    # HTML parsing is CPU-bound; run it in worker processes so it doesn't
+    # stall concurrent fetches on the event loop.
+    with ProcessPoolExecutor() as pool:
+        if args.playwright:
+            # Use hybrid enricher with Playwright for booking systems
+            async with HybridEnricher(
+                headless=True, session=get_shared_session(), executor=pool
+            ) as enricher:
+                result_path = await enricher.enrich_file(
+                    input_path,
+                    output_path,
+                    use_playwright=True,
+                    max_concurrency=args.concurrency,
+                    pretty=args.pretty,
+                    force_refresh=args.force_refresh,
+                    output_format=args.output_format,
+                )
+        else:
+            # Use static enricher only (faster, no browser)
+            enricher = WebsiteEnricher(session=get_shared_session(), executor=pool)
             result_path = await enricher.enrich_file(
                 input_path,
                 output_path,
-                use_playwright=True
+                category=category,
+                use_llm=use_llm,
+                max_concurrency=args.concurrency,
+                pretty=args.pretty,
+                force_refresh=args.force_refresh,
+                output_format=args.output_format,
             )
-    else:
-        # Use static enricher only (faster, no browser)
-        enricher = WebsiteEnricher()
-        result_path = await enricher.enrich_file(
-            input_path,
-            output_path,
-            category=category,
-            use_llm=use_llm
-        )
 
     print(f"\nOutput saved to: {result_path}")
     return 0
@@ -273,25 +490,35 @@ def cmd_stats(_args: argparse.Namespace) -> int:
     return 0
 
 
+async def run_with_shared_session(command, args: argparse.Namespace) -> int:
+    """Run an async command, closing the shared HTTP session afterwards."""
+    try:
+        return await command(args)
+    finally:
+        await close_shared_session()
+
+
+# command -> (handler, is_async)
+COMMANDS = {
+    "search": (cmd_search, True),
+    "search-batch": (cmd_search_batch, True),
+    "fetch": (cmd_fetch, True),
+    "enrich": (cmd_enrich, True),
+    "stats": (cmd_stats, False),
+}
+
+
 def main() -> int:
     """Main entry point."""
     parser = create_parser()
     args = parser.parse_args()
 
-    if not args.command:
-        parser.print_help()
-        return 1
-
-    if args.command == "search":
-        return asyncio.run(cmd_search(args))
-    elif args.command == "fetch":
-        return asyncio.run(cmd_fetch(args))
-    elif args.command == "enrich":
-        return asyncio.run(cmd_enrich(args))
-    elif args.command == "stats":
-        return cmd_stats(args)
+    get_settings().ensure_dirs()
 
-    return 1
+    command, is_async = COMMANDS[args.command]
+    if is_async:
+        return runtime.run(run_with_shared_session(command, args))
+    return command(args)
 
 
 if __name__ == "__main__":
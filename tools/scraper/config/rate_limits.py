@@ -7,6 +7,7 @@ a rate limiter with exponential backoff.
 
 import asyncio
 import time
+from array import array
 from dataclasses import dataclass, field
 from collections import defaultdict
 from typing import Optional
@@ -39,6 +40,9 @@ RATE_LIMITS: dict[str, RateLimitConfig] = {
     ),
 }
 
+# Start time of a domain that hasn't been requested yet
+_NEVER = -(1 << 62)
+
 # Backoff configuration
 BACKOFF_CONFIG = {
     "initial_delay": 1.0,
@@ -62,11 +66,27 @@ class RateLimiter:
     """
 
     def __init__(self):
-        self._last_request: dict[str, float] = defaultdict(float)
-        self._request_counts: dict[str, int] = defaultdict(int)
-        self._daily_counts: dict[str, int] = defaultdict(int)
-        self._failure_counts: dict[str, int] = defaultdict(int)
-        self._lock = asyncio.Lock()
+        # Per-domain state is stored as parallel arrays indexed by a small
+        # interned domain id, so each call does one dict lookup.
+        self._domain_ids: dict[str, int] = {}
+        self._domains: list[str] = []
+        # Monotonic time (ns) at which the last reserved request to each
+        # domain starts; the gap to the next is computed when it's reserved
+        self._last_start = array("q")
+        self._request_counts = array("q")
+        self._failure_counts = array("q")
+        self._daily_counts: dict[str, int] = defaultdict(int)  # by source type
+
+    def _domain_id(self, domain: str) -> int:
+        """Get the id for a domain, allocating its slots on first use."""
+        did = self._domain_ids.get(domain)
+        if did is None:
+            did = self._domain_ids[domain] = len(self._domains)
+            self._domains.append(domain)
+            self._last_start.append(_NEVER)
+            self._request_counts.append(0)
+            self._failure_counts.append(0)
+        return did
 
     async def acquire(self, source_type: str, domain: str) -> None:
         """
@@ -76,57 +96,64 @@ class RateLimiter:
             source_type: Type of source (google_places, website, directory)
             domain: Domain being requested
         """
-        async with self._lock:
-            config = RATE_LIMITS.get(source_type, RATE_LIMITS["website"])
-
-            # Check daily limit
-            if config.daily_limit and self._daily_counts[source_type] >= config.daily_limit:
-                raise RateLimitExceeded(
-                    f"Daily limit of {config.daily_limit} exceeded for {source_type}"
-                )
-
-            # Calculate required delay
-            now = time.time()
-            last = self._last_request[domain]
-            min_interval = 60.0 / config.requests_per_minute
-
-            # Add backoff for failures
-            failure_count = self._failure_counts[domain]
-            if failure_count > 0:
-                backoff = min(
-                    BACKOFF_CONFIG["initial_delay"] * (BACKOFF_CONFIG["multiplier"] ** failure_count),
-                    BACKOFF_CONFIG["max_delay"],
-                )
-                min_interval = max(min_interval, backoff)
-
-            # Ensure minimum delay between requests
-            min_interval = max(min_interval, config.delay_between_requests)
-
-            # Wait if needed
-            elapsed = now - last
-            if elapsed < min_interval:
-                wait_time = min_interval - elapsed
-                await asyncio.sleep(wait_time)
-
-            # Update tracking
-            self._last_request[domain] = time.time()
-            self._request_counts[domain] += 1
-            self._daily_counts[source_type] += 1
+        config = RATE_LIMITS.get(source_type, RATE_LIMITS["website"])
+
+        # Check daily limit
+        if config.daily_limit and self._daily_counts[source_type] >= config.daily_limit:
+            raise RateLimitExceeded(
+                f"Daily limit of {config.daily_limit} exceeded for {source_type}"
+            )
+
+        did = self._domain_id(domain)
+
+        # Calculate required delay
+        min_interval = 60.0 / config.requests_per_minute
+
+        # Add backoff for failures
+        failure_count = self._failure_counts[did]
+        if failure_count > 0:
+            backoff = min(
+                BACKOFF_CONFIG["initial_delay"] * (BACKOFF_CONFIG["multiplier"] ** failure_count),
+                BACKOFF_CONFIG["max_delay"],
+            )
+            min_interval = max(min_interval, backoff)
+
+        # Ensure minimum delay between requests
+        min_interval = max(min_interval, config.delay_between_requests)
+
+        # Reserve the next slot for this domain before awaiting. There is no
+        # await between the read and the write, so concurrent callers on the
+        # (single-threaded) event loop queue up behind each other without a
+        # lock, and requests to different domains never wait on each other.
+        # The interval is added to the previous start here rather than when
+        # that slot was reserved, so failures recorded since then apply to
+        # this request.
+        now = time.monotonic_ns()
+        next_time = max(now, self._last_start[did] + int(min_interval * 1e9))
+        self._last_start[did] = next_time
+
+        # Update tracking
+        self._request_counts[did] += 1
+        self._daily_counts[source_type] += 1
+
+        # Wait for our slot
+        if next_time > now:
+            await asyncio.sleep((next_time - now) / 1e9)
 
     def record_success(self, domain: str) -> None:
         """Record a successful request, resetting failure count."""
-        self._failure_counts[domain] = 0
+        self._failure_counts[self._domain_id(domain)] = 0
 
     def record_failure(self, domain: str) -> None:
         """Record a failed request, incrementing failure count for backoff."""
-        self._failure_counts[domain] += 1
+        self._failure_counts[self._domain_id(domain)] += 1
 
     def get_stats(self) -> dict:
         """Get current rate limiter statistics."""
         return {
-            "request_counts": dict(self._request_counts),
+            "request_counts": dict(zip(self._domains, self._request_counts)),
             "daily_counts": dict(self._daily_counts),
-            "failure_counts": dict(self._failure_counts),
+            "failure_counts": dict(zip(self._domains, self._failure_counts)),
         }
 
     def reset_daily_counts(self) -> None:
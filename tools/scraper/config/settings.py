@@ -21,9 +21,14 @@ except ImportError:
     pass  # python-dotenv not installed, use system env vars
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Scraper configuration settings."""
+    """
+    Scraper configuration settings.
+
+    Immutable: environment variables are read once when the instance is
+    built by get_settings().
+    """
 
     # Paths
     base_dir: Path = field(default_factory=lambda: Path(__file__).parent.parent)
@@ -49,6 +54,7 @@ class Settings:
     respect_robots_txt: bool = True
     max_pages_per_domain: int = 100
     max_providers_per_run: int = 500
+    enrich_concurrency: int = 20  # providers enriched in parallel
 
     # Logging
     log_level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
@@ -56,8 +62,8 @@ class Settings:
     # Token tracking
     token_tracking_enabled: bool = True
 
-    def __post_init__(self):
-        """Ensure directories exist."""
+    def ensure_dirs(self) -> None:
+        """Create output and cache directories (call once at startup)."""
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         (self.cache_dir / "robots").mkdir(exist_ok=True)
@@ -15,10 +15,35 @@ This script:
 
 import argparse
 import asyncio
-import json
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
+
+def scan_providers(providers: list[dict]) -> tuple[int, int, list[dict]]:
+    """
+    Classify providers in a single pass.
+
+    A provider has placeholder services when it has none, or they are all
+    the generic "Massage" entry.
+
+    Returns:
+        (with_website, with_services, to_scrape) where to_scrape are
+        providers with a website but only placeholder services
+    """
+    with_website = with_services = 0
+    to_scrape = []
+    for p in providers:
+        has_url = bool(p.get("websiteUrl"))
+        services = p.get("services") or ()
+        is_placeholder = not services or all(s.get("name") == "Massage" for s in services)
+        with_website += has_url
+        with_services += not is_placeholder
+        if has_url and is_placeholder:
+            to_scrape.append(p)
+    return with_website, with_services, to_scrape
+
 
 async def main():
     parser = argparse.ArgumentParser(description="Enrich provider data with services")
@@ -51,16 +76,13 @@ async def main():
         print(f"Error: Input file not found: {input_path}")
         return 1
 
-    with open(input_path) as f:
-        data = json.load(f)
+    data = orjson.loads(input_path.read_bytes())
 
     providers = data.get("providers", [])
     print(f"Loaded {len(providers)} providers from {input_path.name}")
 
     # Stats
-    with_website = sum(1 for p in providers if p.get("websiteUrl"))
-    with_services = sum(1 for p in providers if len(p.get("services", [])) > 1 or
-                       (p.get("services") and p["services"][0].get("name") != "Massage"))
+    with_website, with_services, to_scrape = scan_providers(providers)
 
     print(f"  With website URL: {with_website}")
     print(f"  With detailed services: {with_services}")
@@ -71,16 +93,8 @@ async def main():
         from sources.google_search import find_missing_websites
         print("\nFinding missing website URLs...")
         providers = await find_missing_websites(providers)
-
-    # Identify providers needing service scraping
-    to_scrape = []
-    for p in providers:
-        if not p.get("websiteUrl"):
-            continue
-        services = p.get("services", [])
-        # Check if services are just placeholder "Massage"
-        if not services or all(s.get("name") == "Massage" for s in services):
-            to_scrape.append(p)
+        # New website URLs change which providers need scraping
+        _, _, to_scrape = scan_providers(providers)
 
     print(f"\n{len(to_scrape)} providers need service menu scraping")
     print(f"Processing first {min(len(to_scrape), args.limit)}")
@@ -120,8 +134,8 @@ async def main():
         ],
     }
 
-    with open(output_path, "w") as f:
-        json.dump(output_data, f, indent=2)
+    # Serialize once and write in a single call
+    Path(output_path).write_bytes(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
 
     print(f"\nSaved to {output_path}")
     print("\nNext step: Use Playwright to scrape service menus from these websites")
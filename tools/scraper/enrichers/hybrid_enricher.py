@@ -5,19 +5,36 @@ Combines Playwright-based booking system scraper with static website enricher.
 Automatically detects the best approach for each provider.
 """
 
-import json
 import asyncio
+from concurrent.futures import Executor
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Optional
 from dataclasses import dataclass
+from urllib.parse import urlparse
 
+import aiohttp
+import orjson
+
+from ..config import get_settings
+from ..normalizers import has_scraped_services
 from .booking_scraper import BookingScraper, BookingSystem
-from .website_enricher import WebsiteEnricher, ExtractedService, EnrichmentResult
+from .website_enricher import (
+    WebsiteEnricher,
+    ExtractedService,
+    EnrichmentResult,
+    OutputFormat,
+    write_enriched_output,
+)
 from ..transformers.service_cleaner import clean_all_providers_async
+from ..utils import runtime
+
 
+# Booking-system pages scraped at once in the shared browser
+MAX_PARALLEL_PAGES = 3
 
-@dataclass
+
+@dataclass(slots=True)
 class HybridEnrichmentResult:
     """Result from hybrid enrichment."""
     provider_name: str
@@ -35,16 +52,34 @@ class HybridEnricher:
     and falls back to static scraper for regular websites.
     """
 
-    def __init__(self, headless: bool = True):
+    def __init__(
+        self,
+        headless: bool = True,
+        session: Optional[aiohttp.ClientSession] = None,
+        executor: Optional[Executor] = None,
+    ):
         self.headless = headless
+        self._session = session
+        self._executor = executor
         self._booking_scraper: Optional[BookingScraper] = None
         self._static_enricher: Optional[WebsiteEnricher] = None
+        # Playwright scrapes share one browser; bound how many pages it has
+        # open at once, separately from static fetches.
+        self._playwright_slots = asyncio.Semaphore(MAX_PARALLEL_PAGES)
+        # Bounds static fetches, including booking sites' static fallback;
+        # enrich_file resizes it to its max_concurrency
+        self._static_slots = asyncio.Semaphore(get_settings().enrich_concurrency)
+        self._host_systems: dict[str, BookingSystem] = {}
+        # URL -> detect_booking_system() result, reused by the Playwright
+        # strategy so each URL is only detected once
+        self._booking_infos: dict = {}
+        self._strategies = (self._playwright_strategy, self._static_strategy)
 
     async def __aenter__(self):
         self._booking_scraper = BookingScraper(headless=self.headless)
         await self._booking_scraper.__aenter__()
 
-        self._static_enricher = WebsiteEnricher()
+        self._static_enricher = WebsiteEnricher(session=self._session, executor=self._executor)
         await self._static_enricher.__aenter__()
 
         return self
@@ -55,12 +90,30 @@ class HybridEnricher:
         if self._static_enricher:
             await self._static_enricher.__aexit__(*args)
 
+    def _booking_system_for(self, url: str) -> BookingSystem:
+        """Get the booking system for a URL, detected once per host."""
+        host = urlparse(url).netloc.lower()
+        system = self._host_systems.get(host)
+        if system is None:
+            system = self._booking_info_for(url).system
+        return system
+
+    def _booking_info_for(self, url: str):
+        """Get a URL's booking info from the scraper, detected once per URL."""
+        info = self._booking_infos.get(url)
+        if info is None:
+            info = self._booking_scraper.detect_booking_system(url)
+            self._booking_infos[url] = info
+            self._host_systems[urlparse(url).netloc.lower()] = info.system
+        return info
+
     async def enrich_provider(self, provider: dict) -> HybridEnrichmentResult:
         """
         Enrich a single provider using the best method.
 
-        1. Check if URL is a known booking system -> use Playwright
-        2. Otherwise -> use static scraper
+        Strategies run in order until one finds services:
+        1. Playwright, if the URL is a known booking system
+        2. Static scraper
         """
         name = provider.get("name", "Unknown")
         url = provider.get("bookingUrl") or provider.get("websiteUrl")
@@ -75,28 +128,55 @@ class HybridEnricher:
                 error="No URL available"
             )
 
-        # Detect booking system
-        booking_info = self._booking_scraper.detect_booking_system(url)
+        result = None
+        for strategy in self._strategies:
+            result = await strategy(provider, url)
+            if result and result.services:
+                return result
+
+        # The static strategy always returns a result (with its error)
+        return result
+
+    async def _playwright_strategy(
+        self, provider: dict, url: str
+    ) -> Optional[HybridEnrichmentResult]:
+        """Scrape a known booking system with Playwright, or None to skip."""
+        if self._booking_system_for(url) == BookingSystem.UNKNOWN:
+            return None
 
-        if booking_info.system != BookingSystem.UNKNOWN:
-            # Use Playwright for booking systems
-            try:
+        booking_info = self._booking_info_for(url)
+        try:
+            async with self._playwright_slots:
+                # Same per-host schedule as static fetches; many
+                # providers share one booking platform's host
+                await self._static_enricher.rate_limiter.acquire(
+                    "website", urlparse(url).netloc
+                )
                 services = await self._booking_scraper._scrape_booking_system(booking_info)
-                if services:
-                    return HybridEnrichmentResult(
-                        provider_name=name,
-                        url=url,
-                        success=True,
-                        services=services,
-                        method="playwright",
-                        booking_system=booking_info.system.value
-                    )
-            except Exception as e:
-                print(f"    Playwright failed: {e}, falling back to static")
-
-        # Fall back to static scraper
+        except Exception as e:
+            print(f"    Playwright failed: {e}, falling back to static")
+            return None
+
+        if not services:
+            return None
+
+        return HybridEnrichmentResult(
+            provider_name=provider.get("name", "Unknown"),
+            url=url,
+            success=True,
+            services=services,
+            method="playwright",
+            booking_system=booking_info.system.value
+        )
+
+    async def _static_strategy(
+        self, provider: dict, url: str
+    ) -> HybridEnrichmentResult:
+        """Scrape the provider's website with the static enricher."""
+        name = provider.get("name", "Unknown")
         try:
-            result = await self._static_enricher.enrich_provider(provider)
+            async with self._static_slots:
+                result = await self._static_enricher.enrich_provider(provider)
             return HybridEnrichmentResult(
                 provider_name=name,
                 url=url,
@@ -119,7 +199,11 @@ class HybridEnricher:
         self,
         input_path: Path,
         output_path: Optional[Path] = None,
-        use_playwright: bool = True
+        use_playwright: bool = True,
+        max_concurrency: Optional[int] = None,
+        pretty: bool = False,
+        force_refresh: bool = False,
+        output_format: OutputFormat = "json",
     ) -> Path:
         """
         Enrich all providers in a JSON file.
@@ -128,15 +212,19 @@ class HybridEnricher:
             input_path: Path to scraped providers JSON
             output_path: Optional output path
             use_playwright: Whether to use Playwright for booking systems
+            max_concurrency: Max providers enriched at once
+                (defaults to settings.enrich_concurrency)
+            pretty: Indent the output JSON for reading (default: compact)
+            force_refresh: Re-scrape providers that already have services
+            output_format: "json" for one document, or "jsonl" for one
+                provider per line plus a .meta.json sidecar
 
         Returns:
             Path to enriched output file
         """
-        with open(input_path) as f:
-            data = json.load(f)
+        data = orjson.loads(Path(input_path).read_bytes())
 
         providers = data.get("providers", [])
-        enriched_providers = []
 
         stats = {
             "total": len(providers),
@@ -144,22 +232,44 @@ class HybridEnricher:
             "playwright": 0,
             "static": 0,
             "failed": 0,
+            "skipped": 0,
             "booking_systems": {}
         }
 
-        print(f"Enriching {len(providers)} providers...")
+        if not force_refresh:
+            # Search output carries a category placeholder service; only
+            # providers with a real (scraped) service are already done
+            pending = [p for p in providers if not has_scraped_services(p.get("services") or ())]
+            stats["skipped"] = len(providers) - len(pending)
+        else:
+            pending = providers
+
+        print(f"Enriching {len(pending)} providers...")
         print(f"  Playwright enabled: {use_playwright}")
 
-        for i, provider in enumerate(providers):
+        self._static_slots = asyncio.Semaphore(max_concurrency or get_settings().enrich_concurrency)
+
+        def is_booking(provider: dict) -> bool:
+            url = provider.get("bookingUrl") or provider.get("websiteUrl")
+            return bool(url) and self._booking_system_for(url) != BookingSystem.UNKNOWN
+
+        async def run(i: int, provider: dict) -> HybridEnrichmentResult:
             name = provider.get("name", "Unknown")
-            print(f"  [{i+1}/{len(providers)}] {name}")
 
             if use_playwright:
-                result = await self.enrich_provider(provider)
-            else:
+                # enrich_provider takes a Playwright page slot for booking
+                # sites and a static slot for any static fetch (including
+                # a booking site's fallback), so neither holds up the other
+                label = " (booking system)" if is_booking(provider) else ""
+                print(f"  [{i+1}/{len(pending)}] {name}{label}")
+                return await self.enrich_provider(provider)
+
+            async with self._static_slots:
+                print(f"  [{i+1}/{len(pending)}] {name}")
+
                 # Static only
                 static_result = await self._static_enricher.enrich_provider(provider)
-                result = HybridEnrichmentResult(
+                return HybridEnrichmentResult(
                     provider_name=name,
                     url=provider.get("websiteUrl", ""),
                     success=static_result.success,
@@ -167,18 +277,23 @@ class HybridEnricher:
                     method="static" if static_result.services else "none"
                 )
 
+        results = await asyncio.gather(
+            *(run(i, p) for i, p in enumerate(pending)),
+            return_exceptions=True,
+        )
+
+        print()
+        for provider, result in zip(pending, results):
+            name = provider.get("name", "Unknown")
+
+            if isinstance(result, Exception):
+                stats["failed"] += 1
+                print(f"  ✗ {name}: {result}")
+                continue
+
             if result.success and result.services:
                 # Update provider with services
-                provider["services"] = [
-                    {
-                        "name": s.name,
-                        "category": s.category,
-                        "durationMin": s.duration_min or 60,
-                        "basePrice": s.price_cents or 10000,
-                        "description": s.description,
-                    }
-                    for s in result.services
-                ]
+                provider["services"] = [s.to_dict() for s in result.services]
                 stats["enriched"] += 1
 
                 if result.method == "playwright":
@@ -186,18 +301,13 @@ class HybridEnricher:
                     if result.booking_system:
                         stats["booking_systems"][result.booking_system] = \
                             stats["booking_systems"].get(result.booking_system, 0) + 1
-                    print(f"    ✓ {len(result.services)} services via {result.booking_system}")
+                    print(f"  ✓ {name}: {len(result.services)} services via {result.booking_system}")
                 else:
                     stats["static"] += 1
-                    print(f"    ✓ {len(result.services)} services via static")
+                    print(f"  ✓ {name}: {len(result.services)} services via static")
             else:
                 stats["failed"] += 1
-                print(f"    ✗ {result.error or 'No services found'}")
-
-            enriched_providers.append(provider)
-
-            # Small delay between providers
-            await asyncio.sleep(0.5)
+                print(f"  ✗ {name}: {result.error or 'No services found'}")
 
         # Build output
         output_data = {
@@ -207,7 +317,7 @@ class HybridEnricher:
                 "enrichment_stats": stats,
                 "enrichment_method": "hybrid" if use_playwright else "static",
             },
-            "providers": enriched_providers,
+            "providers": providers,
         }
 
         # Clean services using service_cleaner (Section 5 rules)
@@ -227,8 +337,7 @@ class HybridEnricher:
             suffix = "_hybrid" if use_playwright else "_enriched"
             output_path = input_path.parent / f"{suffix}_{input_path.name}"
 
-        with open(output_path, "w") as f:
-            json.dump(output_data, f, indent=2, default=str)
+        output_path = write_enriched_output(output_data, output_path, pretty, output_format)
 
         # Print summary
         print(f"\n{'='*50}")
@@ -239,6 +348,7 @@ class HybridEnricher:
         print(f"    - Via Playwright: {stats['playwright']}")
         print(f"    - Via static scraper: {stats['static']}")
         print(f"  Failed: {stats['failed']}")
+        print(f"  Skipped (already enriched): {stats['skipped']}")
 
         if stats["booking_systems"]:
             print(f"\n  Booking systems scraped:")
@@ -302,4 +412,4 @@ if __name__ == "__main__":
             output_path = await enrich_with_booking_systems(headless=headless)
             print(f"\nOutput: {output_path}")
 
-    asyncio.run(main())
+    runtime.run(main())
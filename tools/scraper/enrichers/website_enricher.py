@@ -6,22 +6,84 @@ Uses BeautifulSoup for static sites, falls back to basic parsing.
 """
 
 import re
-import json
 import asyncio
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Literal, Optional
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from urllib.parse import urlparse
 
 import aiohttp
+import orjson
 from bs4 import BeautifulSoup
 
 from ..config import get_settings, RateLimiter
+from ..normalizers import has_scraped_services
 from ..schemas import ServiceCategory
-from ..transformers.service_cleaner import clean_all_providers_async
+from ..transformers.service_cleaner import clean_all_providers_async, clean_extracted_services
+from ..utils.cache import ResponseCache
+from ..utils import runtime
+from ..utils.http import create_session
 
+# selectolax parses several times faster than BeautifulSoup; fall back to
+# bs4 when it isn't installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
 
-@dataclass
+# Pages are truncated after this many bytes
+MAX_PAGE_BYTES = 2_000_000
+
+
+# Defaults for services whose page didn't list a duration or price
+DEFAULT_DURATION_MIN = 60
+DEFAULT_PRICE_CENTS = 10000
+
+
+OutputFormat = Literal["json", "jsonl"]
+
+
+def write_enriched_output(
+    output_data: dict,
+    output_path: Path,
+    pretty: bool = False,
+    output_format: OutputFormat = "json",
+) -> Path:
+    """
+    Write an enrichment result to disk.
+
+    "json" writes output_data as a single document. "jsonl" writes one
+    provider per line to <output>.jsonl and the metadata to
+    <output>.meta.json, so the whole file is never serialized at once.
+
+    Returns:
+        Path to the providers file
+    """
+    output_path = Path(output_path)
+
+    if output_format == "jsonl":
+        meta_path = output_path.with_suffix(".meta.json")
+        meta_path.write_bytes(orjson.dumps(
+            output_data["metadata"],
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2,
+        ))
+
+        output_path = output_path.with_suffix(".jsonl")
+        with open(output_path, "wb") as f:
+            for provider in output_data["providers"]:
+                f.write(orjson.dumps(provider, option=orjson.OPT_NON_STR_KEYS))
+                f.write(b"\n")
+        return output_path
+
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    output_path.write_bytes(orjson.dumps(output_data, option=option))
+    return output_path
+
+
+@dataclass(slots=True)
 class ExtractedService:
     """A service extracted from a website."""
     name: str
@@ -30,8 +92,18 @@ class ExtractedService:
     duration_min: Optional[int] = None
     description: Optional[str] = None
 
+    def to_dict(self) -> dict:
+        """Convert to the provider-file service shape, filling defaults."""
+        return {
+            "name": self.name,
+            "category": self.category,
+            "durationMin": self.duration_min or DEFAULT_DURATION_MIN,
+            "basePrice": self.price_cents or DEFAULT_PRICE_CENTS,
+            "description": self.description,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class EnrichmentResult:
     """Result of enriching a provider."""
     provider_name: str
@@ -82,27 +154,78 @@ SERVICE_PATTERNS = {
     ],
 }
 
+# Compiled once at import; the extractors run these against every line of
+# every page.
+PRICE_RES = [re.compile(p, re.IGNORECASE) for p in PRICE_PATTERNS]
+DURATION_RES = [re.compile(p, re.IGNORECASE) for p in DURATION_PATTERNS]
+
+# Classifies a line in one regex call. Each alternative is a lookahead
+# tried from the start of the text in SERVICE_PATTERNS order, so the first
+# category with any matching pattern wins, as when checking them in turn;
+# the empty named group reports which category matched.
+CATEGORY_RE = re.compile(
+    "|".join(
+        f"(?=.*?(?:{'|'.join(patterns)}))(?P<{category.name}>)"
+        for category, patterns in SERVICE_PATTERNS.items()
+    ),
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Any service keyword; used to jump to candidate lines in page text. The
+# patterns are lowercase, so this is matched case-sensitively against a
+# lowercased copy of the page (faster than IGNORECASE); the _I variant is
+# for text whose length changes when lowercased.
+_SERVICE_KEYWORDS = "|".join(p for patterns in SERVICE_PATTERNS.values() for p in patterns)
+SERVICE_KEYWORD_RE = re.compile(_SERVICE_KEYWORDS)
+SERVICE_KEYWORD_RE_I = re.compile(_SERVICE_KEYWORDS, re.IGNORECASE)
+
+# Lines containing these are code or markup that leaked into page text
+MARKUP_CHARS = frozenset("{}<>")
+
+
+def _text_lines(text: str) -> str:
+    """
+    Strip each line and drop blank ones.
+
+    Prices and durations are read from the line after a service name, so
+    both HTML parsers must give the same lines for the same page.
+    """
+    return "\n".join(line for line in map(str.strip, text.splitlines()) if line)
+
+# Substrings a JSON-LD block needs for _parse_schema_item to find anything
+SCHEMA_SERVICE_MARKERS = ('"Service"', '"Product"', '"Offer"', '"hasOfferCatalog"')
+
 
 class WebsiteEnricher:
     """
     Enriches provider data by scraping their websites for services.
+
+    Pass a ProcessPoolExecutor as executor to parse HTML in worker
+    processes, keeping the event loop free for fetches.
     """
 
-    def __init__(self, rate_limiter: Optional[RateLimiter] = None):
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        executor: Optional[Executor] = None,
+    ):
         self.settings = get_settings()
+        self.executor = executor
         self.rate_limiter = rate_limiter or RateLimiter()
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self.response_cache = ResponseCache()
 
     async def __aenter__(self):
-        self._session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={"User-Agent": self.settings.user_agent}
-        )
+        if self._owns_session and not self._session:
+            self._session = create_session()
         return self
 
     async def __aexit__(self, *args):
-        if self._session:
+        if self._owns_session and self._session:
             await self._session.close()
+            self._session = None
 
     async def enrich_provider(self, provider: dict) -> EnrichmentResult:
         """
@@ -139,7 +262,12 @@ class WebsiteEnricher:
                 )
 
             # Parse and extract services
-            services = self._extract_services(html, url)
+            if self.executor:
+                services = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, parse_services, html, url
+                )
+            else:
+                services = self._extract_services(html, url)
 
             return EnrichmentResult(
                 provider_name=name,
@@ -163,7 +291,11 @@ class WebsiteEnricher:
         input_path: Path,
         output_path: Optional[Path] = None,
         category: str = "MASSAGE",
-        use_llm: bool = True
+        use_llm: bool = True,
+        max_concurrency: Optional[int] = None,
+        pretty: bool = False,
+        force_refresh: bool = False,
+        output_format: OutputFormat = "json",
     ) -> Path:
         """
         Enrich all providers in a scraped JSON file.
@@ -173,44 +305,53 @@ class WebsiteEnricher:
             output_path: Optional output path (defaults to enriched_*.json)
             category: Service category for cleanup rules (default: MASSAGE)
             use_llm: Whether to use LLM for service name filtering
+            max_concurrency: Max providers fetched at once
+                (defaults to settings.enrich_concurrency)
+            pretty: Indent the output JSON for reading (default: compact)
+            force_refresh: Re-scrape providers that already have services
+                (default: keep them, so resumed runs only fetch the rest)
+            output_format: "json" for one document, or "jsonl" for one
+                provider per line plus a .meta.json sidecar
 
         Returns:
             Path to enriched output file
         """
-        with open(input_path) as f:
-            data = json.load(f)
+        data = orjson.loads(Path(input_path).read_bytes())
 
         providers = data.get("providers", [])
-        enriched_providers = []
-        stats = {"total": len(providers), "enriched": 0, "failed": 0}
+        stats = {"total": len(providers), "enriched": 0, "failed": 0, "skipped": 0}
+        if not force_refresh:
+            # Search output carries a category placeholder service; only
+            # providers with a real (scraped) service are already done
+            pending = [p for p in providers if not has_scraped_services(p.get("services") or ())]
+            stats["skipped"] = len(providers) - len(pending)
+        else:
+            pending = providers
+        semaphore = asyncio.Semaphore(max_concurrency or self.settings.enrich_concurrency)
 
-        async with self:
-            for i, provider in enumerate(providers):
-                print(f"  Enriching {i+1}/{len(providers)}: {provider.get('name', 'Unknown')}")
+        async def run(i: int, provider: dict) -> EnrichmentResult:
+            async with semaphore:
+                print(f"  Enriching {i+1}/{len(pending)}: {provider.get('name', 'Unknown')}")
+                return await self.enrich_provider(provider)
 
-                result = await self.enrich_provider(provider)
+        async with self:
+            results = await asyncio.gather(
+                *(run(i, p) for i, p in enumerate(pending))
+            )
 
+            # Providers whose services were cleaned here (by identity)
+            cleaned_here: set[int] = set()
+            for provider, result in zip(pending, results):
                 if result.success and result.services:
-                    # Update provider with enriched services
-                    provider["services"] = [
-                        {
-                            "name": s.name,
-                            "category": s.category,
-                            "durationMin": s.duration_min or 60,
-                            "basePrice": s.price_cents or 10000,
-                            "description": s.description,
-                        }
-                        for s in result.services
-                    ]
+                    # Update provider with enriched services, cleaning the
+                    # names before they become dicts
+                    cleaned = clean_extracted_services(result.services)
+                    provider["services"] = [s.to_dict() for s in cleaned]
+                    cleaned_here.add(id(provider))
                     stats["enriched"] += 1
                 else:
                     stats["failed"] += 1
 
-                enriched_providers.append(provider)
-
-                # Small delay between requests
-                await asyncio.sleep(0.5)
-
         # Build output
         output_data = {
             "metadata": {
@@ -218,14 +359,25 @@ class WebsiteEnricher:
                 "enriched_at": datetime.now(timezone.utc).isoformat(),
                 "enrichment_stats": stats,
             },
-            "providers": enriched_providers,
+            "providers": providers,
         }
 
         # Clean services using service_cleaner (Section 5 rules)
         print("\nCleaning service names...")
         # Use passed category, fallback to metadata, then default
         effective_category = category or data.get("metadata", {}).get("category", "MASSAGE").upper()
-        output_data = await clean_all_providers_async(output_data, category=effective_category, use_llm=use_llm)
+        # Services carried over from the input (skipped providers, or failed
+        # re-scrapes) may not have been through the name rules yet; only
+        # skip them when every provider's services were cleaned here
+        precleaned = all(
+            id(p) in cleaned_here or not p.get("services") for p in providers
+        )
+        output_data = await clean_all_providers_async(
+            output_data,
+            category=effective_category,
+            use_llm=use_llm,
+            precleaned=precleaned,
+        )
 
         # Update stats with cleaning results
         total_services = sum(len(p.get('services', [])) for p in output_data.get('providers', []))
@@ -238,62 +390,105 @@ class WebsiteEnricher:
         if output_path is None:
             output_path = input_path.parent / f"enriched_{input_path.name}"
 
-        with open(output_path, "w") as f:
-            json.dump(output_data, f, indent=2, default=str)
+        output_path = write_enriched_output(output_data, output_path, pretty, output_format)
 
         print(f"\nEnrichment complete:")
         print(f"  Total: {stats['total']}")
         print(f"  Enriched: {stats['enriched']}")
         print(f"  Failed: {stats['failed']}")
+        print(f"  Skipped (already enriched): {stats['skipped']}")
 
         return output_path
 
     async def _fetch_page(self, url: str) -> Optional[str]:
-        """Fetch a webpage."""
+        """Fetch a webpage (served from the response cache when unchanged)."""
         if not self._session:
             return None
 
-        try:
-            # Add delay for rate limiting
-            await asyncio.sleep(self.settings.default_delay_between_requests)
+        cached, fresh = self.response_cache.lookup(url)
+        if fresh:
+            return cached["content"]
 
-            async with self._session.get(url, allow_redirects=True) as response:
+        domain = urlparse(url).netloc
+        try:
+            # Per-host politeness; requests to different hosts don't wait
+            # on each other.
+            await self.rate_limiter.acquire("website", domain)
+
+            async with self._session.get(
+                url,
+                allow_redirects=True,
+                headers=self.response_cache.conditional_headers(cached),
+            ) as response:
+                if response.status == 304 and cached:
+                    self.rate_limiter.record_success(domain)
+                    self.response_cache.touch(url, cached, response.headers)
+                    return cached["content"]
                 if response.status == 200:
-                    return await response.text()
+                    self.rate_limiter.record_success(domain)
+                    # read(n) returns only what's buffered, so collect
+                    # chunks until EOF or the size cap
+                    chunks = []
+                    size = 0
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        chunks.append(chunk)
+                        size += len(chunk)
+                        if size >= MAX_PAGE_BYTES:
+                            break
+                    data = b"".join(chunks)[:MAX_PAGE_BYTES]
+                    html = data.decode(response.charset or "utf-8", errors="replace")
+                    self.response_cache.store(url, html, response.headers)
+                    return html
+                self.rate_limiter.record_failure(domain)
                 return None
         except Exception:
+            self.rate_limiter.record_failure(domain)
             return None
 
     def _extract_services(self, html: str, url: str) -> list[ExtractedService]:
         """Extract services from HTML."""
-        soup = BeautifulSoup(html, "html.parser")
-        services = []
+        if HAS_SELECTOLAX:
+            tree = LexborHTMLParser(html)
 
-        # Try structured data first (Schema.org)
-        schema_services = self._extract_schema_services(soup)
-        if schema_services:
-            return schema_services
+            # Try structured data first (Schema.org)
+            schema_services = self._extract_schema_services(
+                node.text() for node in tree.css('script[type="application/ld+json"]')
+            )
+            if schema_services:
+                return schema_services
 
-        # Try to find service/menu sections
-        text = soup.get_text(separator="\n")
-        services = self._extract_services_from_text(text)
+            # Try to find service/menu sections
+            tree.strip_tags(["script", "style"])
+            root = tree.body or tree.root
+            text = root.text(separator="\n") if root else ""
+        else:
+            soup = BeautifulSoup(html, "lxml")
 
-        return services
+            schema_services = self._extract_schema_services(
+                script.string for script in soup.find_all("script", type="application/ld+json")
+            )
+            if schema_services:
+                return schema_services
 
-    def _extract_schema_services(self, soup: BeautifulSoup) -> list[ExtractedService]:
-        """Extract services from Schema.org JSON-LD."""
+            text = soup.get_text("\n", strip=True)
+
+        return self._extract_services_from_text(_text_lines(text))
+
+    def _extract_schema_services(self, scripts: Iterable[Optional[str]]) -> list[ExtractedService]:
+        """Extract services from Schema.org JSON-LD script bodies."""
         services = []
 
-        for script in soup.find_all("script", type="application/ld+json"):
+        for script in scripts:
+            # Most blocks are WebSite/Organization/BreadcrumbList; only
+            # parse ones that can yield a service
+            if not script or not any(marker in script for marker in SCHEMA_SERVICE_MARKERS):
+                continue
             try:
-                data = json.loads(script.string)
-                if isinstance(data, list):
-                    for item in data:
-                        services.extend(self._parse_schema_item(item))
-                else:
-                    services.extend(self._parse_schema_item(data))
-            except (json.JSONDecodeError, TypeError):
-                pass
+                data = orjson.loads(script)
+            except orjson.JSONDecodeError:
+                continue
+            for item in data if isinstance(data, list) else (data,):
+                services.extend(self._parse_schema_item(item))
 
         return services
 
@@ -310,10 +505,9 @@ class WebsiteEnricher:
             name = data.get("name", "")
             if name:
                 price = self._extract_price_from_schema(data)
-                category = self._categorize_service(name)
                 services.append(ExtractedService(
                     name=name,
-                    category=category.value if category else "MASSAGE",
+                    category=self._name_to_category_value(name),
                     price_cents=price,
                     description=data.get("description"),
                 ))
@@ -326,12 +520,17 @@ class WebsiteEnricher:
                 if name:
                     services.append(ExtractedService(
                         name=name,
-                        category=self._categorize_service(name).value if self._categorize_service(name) else "MASSAGE",
+                        category=self._name_to_category_value(name),
                         description=offer.get("description"),
                     ))
 
         return services
 
+    def _name_to_category_value(self, name: str) -> str:
+        """Category value for a structured-data service name (default MASSAGE)."""
+        category = self._categorize_service(name)
+        return category.value if category else "MASSAGE"
+
     def _extract_price_from_schema(self, data: dict) -> Optional[int]:
         """Extract price from Schema.org data."""
         # Check offers
@@ -350,12 +549,36 @@ class WebsiteEnricher:
         services = []
         seen_names = set()
 
-        # Split into lines and look for service-like patterns
-        lines = text.split("\n")
+        # Only lines containing a service keyword can yield a service, so
+        # search for the next keyword and take its line rather than testing
+        # every line of the page.
+        haystack = text.lower()
+        keyword_re = SERVICE_KEYWORD_RE
+        if len(haystack) != len(text):
+            # Some characters lowercase to several, so offsets wouldn't
+            # line up with the original text
+            haystack, keyword_re = text, SERVICE_KEYWORD_RE_I
+
+        pos = 0
+        while match := keyword_re.search(haystack, pos):
+            if "\n" in match.group():
+                # Patterns like "hair\s*color" can span two lines; lines
+                # are matched one at a time, so look again after this point
+                pos = match.start() + 1
+                continue
 
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line or len(line) > 200:
+            start = text.rfind("\n", 0, match.start()) + 1
+            end = text.find("\n", match.end())
+            if end == -1:
+                end = len(text)
+                next_line = None
+            else:
+                next_end = text.find("\n", end + 1)
+                next_line = text[end + 1:next_end if next_end != -1 else len(text)]
+            pos = end + 1
+
+            line = text[start:end].strip()
+            if len(line) > 200 or not MARKUP_CHARS.isdisjoint(line):
                 continue
 
             # Look for lines that might be service names
@@ -371,13 +594,13 @@ class WebsiteEnricher:
 
             # Try to extract price from this line or nearby lines
             price = self._extract_price_from_text(line)
-            if not price and i + 1 < len(lines):
-                price = self._extract_price_from_text(lines[i + 1])
+            if not price and next_line is not None:
+                price = self._extract_price_from_text(next_line)
 
             # Try to extract duration
             duration = self._extract_duration_from_text(line)
-            if not duration and i + 1 < len(lines):
-                duration = self._extract_duration_from_text(lines[i + 1])
+            if not duration and next_line is not None:
+                duration = self._extract_duration_from_text(next_line)
 
             # Clean up the name
             name = self._clean_service_name(line)
@@ -399,19 +622,13 @@ class WebsiteEnricher:
 
     def _categorize_service(self, text: str) -> Optional[ServiceCategory]:
         """Determine the service category from text."""
-        text_lower = text.lower()
-
-        for category, patterns in SERVICE_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    return category
-
-        return None
+        match = CATEGORY_RE.match(text)
+        return ServiceCategory[match.lastgroup] if match else None
 
     def _extract_price_from_text(self, text: str) -> Optional[int]:
         """Extract price in cents from text."""
-        for pattern in PRICE_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in PRICE_RES:
+            match = pattern.search(text)
             if match:
                 try:
                     price_str = match.group(1).replace(",", "")
@@ -423,13 +640,14 @@ class WebsiteEnricher:
 
     def _extract_duration_from_text(self, text: str) -> Optional[int]:
         """Extract duration in minutes from text."""
-        for pattern in DURATION_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in DURATION_RES:
+            match = pattern.search(text)
             if match:
                 try:
                     value = float(match.group(1))
                     # Check if it's hours
-                    if "hour" in text.lower() or "hr" in text.lower():
+                    lowered = text.lower()
+                    if "hour" in lowered or "hr" in lowered:
                         return int(value * 60)
                     return int(value)
                 except (ValueError, TypeError):
@@ -439,12 +657,12 @@ class WebsiteEnricher:
     def _clean_service_name(self, text: str) -> str:
         """Clean up a service name."""
         # Remove prices
-        for pattern in PRICE_PATTERNS:
-            text = re.sub(pattern, "", text)
+        for pattern in PRICE_RES:
+            text = pattern.sub("", text)
 
         # Remove durations
-        for pattern in DURATION_PATTERNS:
-            text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+        for pattern in DURATION_RES:
+            text = pattern.sub("", text)
 
         # Clean whitespace
         text = " ".join(text.split())
@@ -455,6 +673,22 @@ class WebsiteEnricher:
         return text.strip()
 
 
+_worker_enricher: Optional[WebsiteEnricher] = None
+
+
+def parse_services(html: str, url: str) -> list[ExtractedService]:
+    """
+    Extract services from HTML.
+
+    Module-level so it can be sent to a process pool; each worker builds
+    one enricher on first use. Extraction doesn't touch the session.
+    """
+    global _worker_enricher
+    if _worker_enricher is None:
+        _worker_enricher = WebsiteEnricher()
+    return _worker_enricher._extract_services(html, url)
+
+
 async def enrich_latest(city: str = "new_york_city", category: str = "massage") -> Path:
     """
     Enrich the latest scraped file for a city/category.
@@ -493,4 +727,4 @@ if __name__ == "__main__":
             output_path = await enrich_latest("new_york_city", "massage")
             print(f"Enriched latest to: {output_path}")
 
-    asyncio.run(main())
+    runtime.run(main())
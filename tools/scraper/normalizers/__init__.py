@@ -1,12 +1,21 @@
 """Scraper normalizer modules."""
 
 from .provider import ProviderNormalizer
-from .service import ServiceNormalizer, categorize_service
+from .service import (
+    PLACEHOLDER_SERVICE_NAMES,
+    ServiceNormalizer,
+    categorize_service,
+    category_from_value,
+    has_scraped_services,
+)
 from .dedup import Deduplicator
 
 __all__ = [
     "ProviderNormalizer",
     "ServiceNormalizer",
     "categorize_service",
+    "category_from_value",
+    "has_scraped_services",
+    "PLACEHOLDER_SERVICE_NAMES",
     "Deduplicator",
 ]
@@ -4,6 +4,7 @@ Deduplicator
 Handles provider deduplication and conflict resolution.
 """
 
+import math
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -11,6 +12,10 @@ from ..schemas import ScrapedProvider
 from ..utils.hash import generate_provider_key, normalize_address
 from .provider import ProviderNormalizer
 
+# Names whose token Jaccard similarity is above this are reported as
+# fuzzy duplicates
+FUZZY_NAME_THRESHOLD = 0.8
+
 
 @dataclass
 class DuplicateMatch:
@@ -35,6 +40,14 @@ class Deduplicator:
         self._index: dict[str, ScrapedProvider] = {}
         self._phone_index: dict[str, str] = {}  # phone -> provider_key
         self._url_index: dict[str, str] = {}  # url -> provider_key
+        # city -> name token -> keys of providers with that token. A name
+        # sharing no token with another can't reach the fuzzy-match
+        # threshold, so find_duplicates only scores providers found here.
+        # Keys are kept in dicts (ordered sets) so results are deterministic.
+        self._token_index: dict[str, dict[str, dict[str, None]]] = {}
+        # provider_key -> lowercase name tokens / city of the stored provider
+        self._name_tokens: dict[str, frozenset[str]] = {}
+        self._city_lower: dict[str, str] = {}
         self.normalizer = ProviderNormalizer()
 
     def add(self, provider: ScrapedProvider) -> tuple[bool, Optional[ScrapedProvider]]:
@@ -56,6 +69,7 @@ class Deduplicator:
             existing = self._index[key]
             merged = self.normalizer.merge(existing, provider)
             self._index[key] = merged
+            self._index_tokens(key, merged)
             return False, merged
 
         # Check for phone match
@@ -64,6 +78,7 @@ class Deduplicator:
             existing = self._index[existing_key]
             merged = self.normalizer.merge(existing, provider)
             self._index[existing_key] = merged
+            self._index_tokens(existing_key, merged)
             return False, merged
 
         # Check for URL match
@@ -72,10 +87,12 @@ class Deduplicator:
             existing = self._index[existing_key]
             merged = self.normalizer.merge(existing, provider)
             self._index[existing_key] = merged
+            self._index_tokens(existing_key, merged)
             return False, merged
 
         # New provider
         self._index[key] = provider
+        self._index_tokens(key, provider)
         if provider.phone:
             self._phone_index[provider.phone] = key
         if provider.website_url:
@@ -105,9 +122,13 @@ class Deduplicator:
             ))
             return matches  # Exact match found
 
+        # Index keys already matched; each stored provider is reported once
+        seen_keys: set[str] = set()
+
         # Check phone match
         if provider.phone and provider.phone in self._phone_index:
             existing_key = self._phone_index[provider.phone]
+            seen_keys.add(existing_key)
             matches.append(DuplicateMatch(
                 provider=self._index[existing_key],
                 similarity_score=0.9,
@@ -117,7 +138,8 @@ class Deduplicator:
         # Check URL match
         if provider.website_url and provider.website_url in self._url_index:
             existing_key = self._url_index[provider.website_url]
-            if not any(m.provider == self._index[existing_key] for m in matches):
+            if existing_key not in seen_keys:
+                seen_keys.add(existing_key)
                 matches.append(DuplicateMatch(
                     provider=self._index[existing_key],
                     similarity_score=0.85,
@@ -125,32 +147,85 @@ class Deduplicator:
                 ))
 
         # Check fuzzy name match in same city
-        for existing_key, existing in self._index.items():
-            if existing.city.lower() == provider.city.lower():
-                name_similarity = self._name_similarity(provider.name, existing.name)
-                if name_similarity > 0.8:
-                    if not any(m.provider == existing for m in matches):
-                        matches.append(DuplicateMatch(
-                            provider=existing,
-                            similarity_score=name_similarity,
-                            match_reasons=["fuzzy_name"],
-                        ))
+        city = provider.city.lower()
+        for existing_key, name_similarity in self._fuzzy_candidates(provider.name.lower(), city):
+            if self._city_lower[existing_key] == city and name_similarity > FUZZY_NAME_THRESHOLD:
+                if existing_key not in seen_keys:
+                    seen_keys.add(existing_key)
+                    matches.append(DuplicateMatch(
+                        provider=self._index[existing_key],
+                        similarity_score=name_similarity,
+                        match_reasons=["fuzzy_name"],
+                    ))
 
         return sorted(matches, key=lambda m: m.similarity_score, reverse=True)
 
-    def _name_similarity(self, name1: str, name2: str) -> float:
-        """Calculate similarity between two business names."""
-        # Simple normalized comparison
-        n1 = set(name1.lower().split())
-        n2 = set(name2.lower().split())
+    def _index_tokens(self, key: str, provider: ScrapedProvider) -> None:
+        """Add a stored provider's name tokens to the fuzzy-match index."""
+        city = provider.city.lower()
+        tokens = frozenset(provider.name.lower().split())
+        self._name_tokens[key] = tokens
+        self._city_lower[key] = city
+
+        city_index = self._token_index.setdefault(city, {})
+        for token in tokens:
+            city_index.setdefault(token, {})[key] = None
+
+    def _fuzzy_candidates(self, name: str, city: str) -> list[tuple[str, float]]:
+        """
+        Score indexed names in a city against a lowercase name.
 
+        Returns:
+            (provider_key, similarity in 0-1) pairs, possibly including
+            keys whose provider has since moved city (checked by caller)
+        """
+        # Prefix filter: a name with Jaccard >= t against these tokens shares
+        # at least ceil(t * n) of them, so it holds one of any
+        # n - ceil(t * n) + 1. Probing only the rarest that many tokens
+        # finds every match without collecting keys for common words
+        # like "spa". (The epsilon keeps float error on the safe side.)
+        tokens = frozenset(name.split())
+        city_index = self._token_index.get(city, {})
+        required = math.ceil(FUZZY_NAME_THRESHOLD * len(tokens) - 1e-9)
+        probes = sorted(tokens, key=lambda t: len(city_index.get(t, ())))
+        candidates: dict[str, None] = {}
+        for token in probes[:len(tokens) - required + 1]:
+            candidates.update(city_index.get(token, {}))
+        return [
+            (key, self._name_similarity(tokens, self._name_tokens[key]))
+            for key in candidates
+        ]
+
+    def _name_similarity(self, n1: frozenset[str], n2: frozenset[str]) -> float:
+        """Calculate similarity between two business names' lowercase tokens."""
         if not n1 or not n2:
             return 0.0
 
-        intersection = n1 & n2
-        union = n1 | n2
+        # |union| = |n1| + |n2| - |intersection|; no need to build it
+        intersection = len(n1 & n2)
+        return intersection / (len(n1) + len(n2) - intersection)
+
+    def key_for(self, provider: ScrapedProvider) -> Optional[str]:
+        """
+        Get the index key a provider is stored under.
+
+        Resolves the same way add() does: exact key, then phone, then URL.
+
+        Returns:
+            Index key, or None if the provider isn't indexed
+        """
+        key = generate_provider_key(provider.name, provider.address, provider.city)
+        if key in self._index:
+            return key
+        if provider.phone and provider.phone in self._phone_index:
+            return self._phone_index[provider.phone]
+        if provider.website_url and provider.website_url in self._url_index:
+            return self._url_index[provider.website_url]
+        return None
 
-        return len(intersection) / len(union)
+    def get(self, key: str) -> Optional[ScrapedProvider]:
+        """Get the current (merged) provider for an index key."""
+        return self._index.get(key)
 
     def get_all(self) -> list[ScrapedProvider]:
         """Get all unique providers."""
@@ -165,3 +240,6 @@ class Deduplicator:
         self._index.clear()
         self._phone_index.clear()
         self._url_index.clear()
+        self._token_index.clear()
+        self._name_tokens.clear()
+        self._city_lower.clear()
@@ -11,6 +11,50 @@ from ..schemas import ScrapedProvider
 from ..utils.hash import normalize_phone, normalize_address
 
 
+# Trailing name suffixes that don't add value: everything from the first
+# "|" ("| City Name" etc), else "- Home" and/or a legal suffix, in one pass
+_SUFFIX_RE = re.compile(
+    r"\s*\|.*$|(?:\s*-\s*home)?(?:,?\s*(?:llc|inc|corp|ltd|llp)\.?)?$",
+    re.IGNORECASE,
+)
+# Endings _SUFFIX_RE needs (besides "|"); names without them skip the regex
+_SUFFIX_ENDINGS = ("llc", "inc", "corp", "ltd", "llp", "home")
+
+
+# Full US state names -> 2-letter abbreviations
+_STATE_MAP = {
+    "ALABAMA": "AL", "ALASKA": "AK", "ARIZONA": "AZ", "ARKANSAS": "AR",
+    "CALIFORNIA": "CA", "COLORADO": "CO", "CONNECTICUT": "CT", "DELAWARE": "DE",
+    "FLORIDA": "FL", "GEORGIA": "GA", "HAWAII": "HI", "IDAHO": "ID",
+    "ILLINOIS": "IL", "INDIANA": "IN", "IOWA": "IA", "KANSAS": "KS",
+    "KENTUCKY": "KY", "LOUISIANA": "LA", "MAINE": "ME", "MARYLAND": "MD",
+    "MASSACHUSETTS": "MA", "MICHIGAN": "MI", "MINNESOTA": "MN", "MISSISSIPPI": "MS",
+    "MISSOURI": "MO", "MONTANA": "MT", "NEBRASKA": "NE", "NEVADA": "NV",
+    "NEW HAMPSHIRE": "NH", "NEW JERSEY": "NJ", "NEW MEXICO": "NM", "NEW YORK": "NY",
+    "NORTH CAROLINA": "NC", "NORTH DAKOTA": "ND", "OHIO": "OH", "OKLAHOMA": "OK",
+    "OREGON": "OR", "PENNSYLVANIA": "PA", "RHODE ISLAND": "RI", "SOUTH CAROLINA": "SC",
+    "SOUTH DAKOTA": "SD", "TENNESSEE": "TN", "TEXAS": "TX", "UTAH": "UT",
+    "VERMONT": "VT", "VIRGINIA": "VA", "WASHINGTON": "WA", "WEST VIRGINIA": "WV",
+    "WISCONSIN": "WI", "WYOMING": "WY", "DISTRICT OF COLUMBIA": "DC",
+}
+
+# Fields merge() fills from the lower-priority record when missing
+_MERGE_FIELDS = (
+    "name", "address", "city", "state", "zip_code", "country", "legal_name",
+    "website_url", "latitude", "longitude", "phone", "email", "booking_url",
+    "services", "opening_hours", "google_rating", "google_review_count",
+    "social_links",
+)
+
+# Source type -> merge priority (higher wins)
+_SRC_PRIORITY = {"GOOGLE_MAPS": 3, "WEBSITE": 2, "DIRECTORY": 1, "SEARCH": 0}
+
+
+def _source_priority(provider: ScrapedProvider) -> int:
+    """Highest merge priority among a provider's sources (0 if none)."""
+    return max((_SRC_PRIORITY.get(s.type.value, 0) for s in provider.sources), default=0)
+
+
 class ProviderNormalizer:
     """
     Normalizes provider data for consistency.
@@ -32,18 +76,46 @@ class ProviderNormalizer:
         Returns:
             Normalized provider
         """
-        # Normalize name
-        provider.name = self._normalize_name(provider.name)
-
-        # Normalize address
-        provider.address = normalize_address(provider.address)
-
         # Normalize city
         provider.city = self._normalize_city(provider.city)
 
         # Normalize state
         provider.state = self._normalize_state(provider.state)
 
+        return self._normalize_own_fields(provider)
+
+    def normalize_batch(self, providers: list[ScrapedProvider]) -> list[ScrapedProvider]:
+        """
+        Normalize many providers at once.
+
+        Same result as normalize() on each, but city and state are
+        normalized once per distinct value; a batch usually comes from a
+        handful of cities, so most of those calls are skipped.
+
+        Args:
+            providers: Raw scraped providers (modified in place)
+
+        Returns:
+            The same providers, normalized
+        """
+        cities = {city: self._normalize_city(city) for city in {p.city for p in providers}}
+        states = {state: self._normalize_state(state) for state in {p.state for p in providers}}
+
+        for provider in providers:
+            provider.city = cities[provider.city]
+            provider.state = states[provider.state]
+            self._normalize_own_fields(provider)
+
+        return providers
+
+    def _normalize_own_fields(self, provider: ScrapedProvider) -> ScrapedProvider:
+        """Normalize the fields that are specific to one provider."""
+        # Normalize name
+        provider.name = self._normalize_name(provider.name)
+
+        # Normalize address
+        provider.address = normalize_address(provider.address)
+
         # Normalize phone
         if provider.phone:
             provider.phone = normalize_phone(provider.phone)
@@ -64,16 +136,11 @@ class ProviderNormalizer:
             return name
 
         # Remove extra whitespace
-        name = re.sub(r"\s+", " ", name.strip())
+        name = " ".join(name.split())
 
         # Remove common suffixes that don't add value
-        suffixes = [
-            r",?\s*(llc|inc|corp|ltd|llp)\.?$",
-            r"\s*-\s*home$",
-            r"\s*\|\s*.*$",  # Remove "| City Name" etc
-        ]
-        for suffix in suffixes:
-            name = re.sub(suffix, "", name, flags=re.IGNORECASE)
+        if "|" in name or name[-6:].rstrip(".").lower().endswith(_SUFFIX_ENDINGS):
+            name = _SUFFIX_RE.sub("", name, count=1)
 
         # Title case if all caps or all lower
         if name.isupper() or name.islower():
@@ -87,7 +154,7 @@ class ProviderNormalizer:
             return city
 
         # Remove extra whitespace
-        city = re.sub(r"\s+", " ", city.strip())
+        city = " ".join(city.split())
 
         # Title case
         city = city.title()
@@ -106,23 +173,7 @@ class ProviderNormalizer:
             return state
 
         # Map full names to abbreviations
-        state_map = {
-            "ALABAMA": "AL", "ALASKA": "AK", "ARIZONA": "AZ", "ARKANSAS": "AR",
-            "CALIFORNIA": "CA", "COLORADO": "CO", "CONNECTICUT": "CT", "DELAWARE": "DE",
-            "FLORIDA": "FL", "GEORGIA": "GA", "HAWAII": "HI", "IDAHO": "ID",
-            "ILLINOIS": "IL", "INDIANA": "IN", "IOWA": "IA", "KANSAS": "KS",
-            "KENTUCKY": "KY", "LOUISIANA": "LA", "MAINE": "ME", "MARYLAND": "MD",
-            "MASSACHUSETTS": "MA", "MICHIGAN": "MI", "MINNESOTA": "MN", "MISSISSIPPI": "MS",
-            "MISSOURI": "MO", "MONTANA": "MT", "NEBRASKA": "NE", "NEVADA": "NV",
-            "NEW HAMPSHIRE": "NH", "NEW JERSEY": "NJ", "NEW MEXICO": "NM", "NEW YORK": "NY",
-            "NORTH CAROLINA": "NC", "NORTH DAKOTA": "ND", "OHIO": "OH", "OKLAHOMA": "OK",
-            "OREGON": "OR", "PENNSYLVANIA": "PA", "RHODE ISLAND": "RI", "SOUTH CAROLINA": "SC",
-            "SOUTH DAKOTA": "SD", "TENNESSEE": "TN", "TEXAS": "TX", "UTAH": "UT",
-            "VERMONT": "VT", "VIRGINIA": "VA", "WASHINGTON": "WA", "WEST VIRGINIA": "WV",
-            "WISCONSIN": "WI", "WYOMING": "WY", "DISTRICT OF COLUMBIA": "DC",
-        }
-
-        return state_map.get(state, state)
+        return _STATE_MAP.get(state, state)
 
     def _normalize_url(self, url: str) -> str:
         """Normalize URL."""
@@ -154,6 +205,8 @@ class ProviderNormalizer:
         """
         Merge two provider records, preferring data from higher-priority sources.
 
+        The higher-priority record is updated in place and returned.
+
         Args:
             existing: Existing provider record
             new: New provider record
@@ -161,46 +214,17 @@ class ProviderNormalizer:
         Returns:
             Merged provider
         """
-        # Determine which has higher priority
-        existing_priority = max(
-            (s.type.value for s in existing.sources),
-            default=0,
-            key=lambda t: {"GOOGLE_MAPS": 3, "WEBSITE": 2, "DIRECTORY": 1, "SEARCH": 0}.get(t, 0),
-        )
-        new_priority = max(
-            (s.type.value for s in new.sources),
-            default=0,
-            key=lambda t: {"GOOGLE_MAPS": 3, "WEBSITE": 2, "DIRECTORY": 1, "SEARCH": 0}.get(t, 0),
-        )
-
         # Use higher priority as base
-        if new_priority > existing_priority:
+        if _source_priority(new) > _source_priority(existing):
             base, secondary = new, existing
         else:
             base, secondary = existing, new
 
-        # Fill in missing fields from secondary
-        merged = ScrapedProvider(
-            name=base.name or secondary.name,
-            address=base.address or secondary.address,
-            city=base.city or secondary.city,
-            state=base.state or secondary.state,
-            zip_code=base.zip_code or secondary.zip_code,
-            country=base.country or secondary.country,
-            legal_name=base.legal_name or secondary.legal_name,
-            website_url=base.website_url or secondary.website_url,
-            latitude=base.latitude or secondary.latitude,
-            longitude=base.longitude or secondary.longitude,
-            phone=base.phone or secondary.phone,
-            email=base.email or secondary.email,
-            booking_url=base.booking_url or secondary.booking_url,
-            services=base.services or secondary.services,
-            opening_hours=base.opening_hours or secondary.opening_hours,
-            google_rating=base.google_rating or secondary.google_rating,
-            google_review_count=base.google_review_count or secondary.google_review_count,
-            social_links=base.social_links or secondary.social_links,
-            sources=base.sources + secondary.sources,
-            confidence=max(base.confidence, secondary.confidence),
-        )
-
-        return merged
+        # Fill in missing fields from secondary, in place on base
+        for field in _MERGE_FIELDS:
+            if not getattr(base, field):
+                setattr(base, field, getattr(secondary, field))
+        base.sources = base.sources + secondary.sources
+        base.confidence = max(base.confidence, secondary.confidence)
+
+        return base
@@ -5,10 +5,21 @@ Normalizes and categorizes scraped service data.
 """
 
 import re
-from typing import Optional
+from functools import cache, lru_cache
+from typing import Iterable, Optional
 
 from ..schemas import ScrapedService, ServiceCategory
 
+# Aho-Corasick finds every category keyword in one pass over the text;
+# fall back to a substring test per keyword when it isn't installed
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+_HOUR_RE = re.compile(r"(\d+)\s*(?:hour|hr|h)")
+_MIN_RE = re.compile(r"(\d+)\s*(?:minute|min|m)")
 
 # Keywords that map to service categories
 CATEGORY_KEYWORDS: dict[ServiceCategory, list[str]] = {
@@ -43,10 +54,67 @@ CATEGORY_KEYWORDS: dict[ServiceCategory, list[str]] = {
 }
 
 
+_CATEGORIES = tuple(CATEGORY_KEYWORDS)
+
+# Generic service a search source gives each provider for its category
+# (e.g. "Massage") until the real menu is scraped
+PLACEHOLDER_SERVICE_NAMES: dict[ServiceCategory, str] = {
+    c: c.value.replace("_", " ").title() for c in ServiceCategory
+}
+_PLACEHOLDER_NAMES = frozenset(PLACEHOLDER_SERVICE_NAMES.values())
+
+
+def _build_keyword_automaton():
+    """Map each keyword to (index into _CATEGORIES, keyword)."""
+    automaton = ahocorasick.Automaton()
+    for i, keywords in enumerate(CATEGORY_KEYWORDS.values()):
+        for kw in keywords:
+            automaton.add_word(kw, (i, kw))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if HAS_AHOCORASICK else None
+
+
+def _starts_word(text: str, start: int) -> bool:
+    """Whether text[start] begins a word (so "hair" doesn't match "chair")."""
+    return start == 0 or not text[start - 1].isalnum()
+
+
+def _has_keyword(text: str, kw: str) -> bool:
+    """Whether kw occurs in text at the start of a word."""
+    start = text.find(kw)
+    while start != -1:
+        if _starts_word(text, start):
+            return True
+        start = text.find(kw, start + 1)
+    return False
+
+
+def has_scraped_services(services: Iterable[dict]) -> bool:
+    """Whether any service dict is more than a category placeholder."""
+    return any(s.get("name") not in _PLACEHOLDER_NAMES for s in services)
+
+
+@cache
+def category_from_value(value: str) -> ServiceCategory:
+    """
+    Look up a ServiceCategory by value, memoized per string.
+
+    Raises:
+        ValueError: If value isn't a valid category
+    """
+    return ServiceCategory(value)
+
+
+@lru_cache(maxsize=8192)
 def categorize_service(name: str, description: Optional[str] = None) -> ServiceCategory:
     """
     Categorize a service based on its name and description.
 
+    Memoized; the same service names recur across providers.
+
     Args:
         name: Service name
         description: Optional service description
@@ -56,16 +124,27 @@ def categorize_service(name: str, description: Optional[str] = None) -> ServiceC
     """
     text = f"{name} {description or ''}".lower()
 
-    # Count keyword matches for each category
-    scores: dict[ServiceCategory, int] = {}
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        score = sum(1 for kw in keywords if kw in text)
-        if score > 0:
-            scores[category] = score
-
-    # Return highest scoring category, or default to MASSAGE
-    if scores:
-        return max(scores, key=lambda c: scores[c])
+    # Count keyword matches for each category (each keyword once). Keywords
+    # must start a word but may run on, so plurals like "nails" still count.
+    if _KEYWORD_AUTOMATON is not None:
+        counts = [0] * len(_CATEGORIES)
+        hits = {
+            value
+            for end, value in _KEYWORD_AUTOMATON.iter(text)
+            if _starts_word(text, end - len(value[1]) + 1)
+        }
+        for i, _ in hits:
+            counts[i] += 1
+    else:
+        counts = [
+            sum(1 for kw in keywords if _has_keyword(text, kw))
+            for keywords in CATEGORY_KEYWORDS.values()
+        ]
+
+    # Return highest scoring category (earliest on ties), or default to MASSAGE
+    best = max(range(len(counts)), key=counts.__getitem__)
+    if counts[best]:
+        return _CATEGORIES[best]
 
     return ServiceCategory.MASSAGE
 
@@ -124,7 +203,7 @@ class ServiceNormalizer:
             return name
 
         # Remove extra whitespace
-        name = re.sub(r"\s+", " ", name.strip())
+        name = " ".join(name.split())
 
         # Title case if needed
         if name.isupper() or name.islower():
@@ -138,7 +217,7 @@ class ServiceNormalizer:
             return description
 
         # Remove extra whitespace
-        description = re.sub(r"\s+", " ", description.strip())
+        description = " ".join(description.split())
 
         # Limit length
         if len(description) > 500:
@@ -146,9 +225,11 @@ class ServiceNormalizer:
 
         return description
 
-    def parse_price(self, price_str: str) -> Optional[int]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse_price(price_str: str) -> Optional[int]:
         """
-        Parse a price string to cents.
+        Parse a price string to cents (memoized).
 
         Args:
             price_str: Price string (e.g., "$50", "50.00", "$50-$100")
@@ -160,7 +241,7 @@ class ServiceNormalizer:
             return None
 
         # Remove currency symbols and whitespace
-        cleaned = re.sub(r"[$\s]", "", price_str)
+        cleaned = "".join(price_str.split()).replace("$", "")
 
         # Handle range (take first value)
         if "-" in cleaned:
@@ -179,9 +260,11 @@ class ServiceNormalizer:
         except ValueError:
             return None
 
-    def parse_duration(self, duration_str: str) -> Optional[int]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse_duration(duration_str: str) -> Optional[int]:
         """
-        Parse a duration string to minutes.
+        Parse a duration string to minutes (memoized).
 
         Args:
             duration_str: Duration string (e.g., "60 min", "1 hour", "1h 30m")
@@ -196,19 +279,19 @@ class ServiceNormalizer:
         total_minutes = 0
 
         # Look for hours
-        hour_match = re.search(r"(\d+)\s*(?:hour|hr|h)", duration_str)
+        hour_match = _HOUR_RE.search(duration_str)
         if hour_match:
             total_minutes += int(hour_match.group(1)) * 60
 
         # Look for minutes
-        min_match = re.search(r"(\d+)\s*(?:minute|min|m)", duration_str)
+        min_match = _MIN_RE.search(duration_str)
         if min_match:
             total_minutes += int(min_match.group(1))
 
         # If no units found, assume minutes
         if total_minutes == 0:
             try:
-                total_minutes = int(re.sub(r"[^\d]", "", duration_str))
+                total_minutes = int("".join(filter(str.isdecimal, duration_str)))
             except ValueError:
                 return None
 
@@ -16,11 +16,12 @@ Usage:
 """
 
 import argparse
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from schemas import ScrapedService, ServiceCategory
 
 
@@ -39,11 +40,13 @@ Rules:
 
 Do not include any explanation, just the JSON array."""
 
+# Category values a scraped service may use
+_VALID_CATEGORIES = frozenset(c.value for c in ServiceCategory)
+
 
 def load_providers(input_path: str) -> tuple[dict, list[dict]]:
     """Load providers from JSON file."""
-    with open(input_path) as f:
-        data = json.load(f)
+    data = orjson.loads(Path(input_path).read_bytes())
     return data.get("metadata", {}), data.get("providers", [])
 
 
@@ -60,6 +63,11 @@ def get_providers_needing_services(providers: list[dict]) -> list[dict]:
     return needs_scraping
 
 
+def name_key(name: str) -> str:
+    """Key for matching scraped results to providers: case and spacing ignored."""
+    return " ".join(name.split()).casefold()
+
+
 def generate_prompts(providers: list[dict], limit: int = 10) -> list[dict]:
     """Generate WebFetch prompts for providers."""
     prompts = []
@@ -83,10 +91,10 @@ def parse_service_json(json_str: str) -> list[dict]:
     json_str = json_str.strip()
 
     try:
-        services = json.loads(json_str)
+        services = orjson.loads(json_str)
         if isinstance(services, list):
             return services
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         pass
 
     return []
@@ -103,8 +111,7 @@ def normalize_services(raw_services: list[dict]) -> list[dict]:
 
         # Validate category
         category = svc.get("category", "MASSAGE")
-        valid_categories = [c.value for c in ServiceCategory]
-        if category not in valid_categories:
+        if category not in _VALID_CATEGORIES:
             category = "MASSAGE"
 
         # Build normalized service
@@ -132,9 +139,12 @@ def normalize_services(raw_services: list[dict]) -> list[dict]:
     return normalized
 
 
-def enrich_provider(provider: dict, services: list[dict], source_url: str) -> dict:
-    """Add scraped services to provider."""
-    provider = provider.copy()
+def enrich_provider(
+    provider: dict, services: list[dict], source_url: str, *, copy: bool = True
+) -> dict:
+    """Add scraped services to provider (to a copy unless copy=False)."""
+    if copy:
+        provider = provider.copy()
 
     if services:
         provider["services"] = services
@@ -178,30 +188,31 @@ def main():
 
         # Save prompts to file
         prompts_file = Path(args.input).parent / "service_prompts.json"
-        with open(prompts_file, "w") as f:
-            json.dump(prompts, f, indent=2)
+        prompts_file.write_bytes(orjson.dumps(prompts, option=orjson.OPT_INDENT_2))
         print(f"Saved prompts to {prompts_file}")
 
     elif args.results:
         # Process scraped results
-        with open(args.results) as f:
-            results = json.load(f)
+        results = orjson.loads(Path(args.results).read_bytes())
 
-        # Build lookup by provider name
-        results_by_name = {r["provider_name"]: r for r in results}
+        # Build lookup by provider name (the LLM may not echo it exactly)
+        results_by_name = {name_key(r["provider_name"]): r for r in results}
 
         # Enrich providers
         enriched = []
         enriched_count = 0
 
         for p in providers:
-            if p["name"] in results_by_name:
-                result = results_by_name[p["name"]]
+            result = results_by_name.get(name_key(p["name"]))
+            if result is not None:
                 raw_services = parse_service_json(result.get("services_json", "[]"))
                 services = normalize_services(raw_services)
 
                 if services:
-                    p = enrich_provider(p, services, result.get("website_url", ""))
+                    # p came from our own load_providers(); update it in place
+                    p = enrich_provider(
+                        p, services, result.get("website_url", ""), copy=False
+                    )
                     enriched_count += 1
                     print(f"  {p['name']}: {len(services)} services")
 
@@ -220,8 +231,7 @@ def main():
             "providers": enriched,
         }
 
-        with open(output_path, "w") as f:
-            json.dump(output_data, f, indent=2)
+        Path(output_path).write_bytes(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
 
         print(f"Saved to {output_path}")
 
@@ -6,17 +6,103 @@ Extracts service names, prices, and durations.
 """
 
 import asyncio
-import json
 import re
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Awaitable, Callable, ClassVar, Iterator, Optional
 from urllib.parse import urljoin, urlparse
 
+import aiohttp
+from bs4 import BeautifulSoup
+
 from ..schemas import ScrapedService, ServiceCategory
-from ..normalizers.service import categorize_service, ServiceNormalizer
+from ..normalizers.service import categorize_service, has_scraped_services, ServiceNormalizer
+from ..utils.cache import ResponseCache
+from ..utils.http import HttpClient, HttpError
+
+# selectolax tokenizes HTML in C and handles unquoted and entity-encoded
+# hrefs; fall back to a regex scan when it isn't installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+# Playwright renders menus that only appear after JavaScript runs; without
+# it, JS-only menus are left for manual scraping
+try:
+    from playwright.async_api import async_playwright
+    HAS_PLAYWRIGHT = True
+except ImportError:
+    HAS_PLAYWRIGHT = False
+
+_HREF_RE = re.compile(r'href=["\']([^"\']+)["\']', re.IGNORECASE)
+# "Service Name - $XX" or "Service Name ... $XX"
+_PRICE_RE = re.compile(r'([A-Za-z][A-Za-z\s&\'-]+?)[\s\.\-–—]+\$(\d+(?:\.\d{2})?)')
+# "XX min/minutes Service Name"
+_DURATION_RE = re.compile(
+    r'(\d+)\s*(?:min|minutes?)\s+([A-Za-z][A-Za-z\s&\'-]+?)(?:\s*[\-–—]\s*\$(\d+))?',
+    re.IGNORECASE,
+)
+
+# Menu page URLs find_menu_links returns at most
+MAX_MENU_LINKS = 10
+# Providers whose menus are fetched at once
+MAX_CONCURRENT_PROVIDERS = 8
+# Menu pages tried per provider after its homepage
+MAX_MENU_PAGES = 3
+# Pages rendered at once in the shared Playwright browser
+MAX_PARALLEL_PAGES = 3
+# Milliseconds to wait for a rendered page to settle
+PAGE_TIMEOUT_MS = 30_000
+
+
+# Playwright MCP steps returned by get_scrape_instructions (shared, read-only)
+_SCRAPE_STEPS = (
+    "1. Navigate to start_url",
+    "2. Take a snapshot to find menu/services links",
+    "3. Click on menu/services link if found",
+    "4. Take snapshot of menu page",
+    "5. Extract all visible service names, prices, durations",
+    "6. Return extracted data for parsing",
+)
+
+# Page text sent to the LLM is truncated to this many characters
+MAX_PROMPT_PAGE_CHARS = 8000
+# Inline scripts and styles, which carry no menu text
+_NOISE_RE = re.compile(r"<(script|style)\b[^>]*>.*?</\1\s*>", re.DOTALL | re.IGNORECASE)
+
+_LLM_PROMPT = """Extract massage/spa services from this webpage content for "{provider_name}".
+
+For each service found, extract:
+- name: Service name (e.g., "Swedish Massage", "Deep Tissue 60min")
+- price: Price in dollars (e.g., 80, 120) - just the number
+- duration: Duration in minutes (e.g., 60, 90) - just the number
+- category: One of MASSAGE, ACUPUNCTURE, NAILS, HAIR, FACIALS_AND_SKIN, LASHES_AND_BROWS
+
+Return JSON array only, no explanation:
+[{{"name": "...", "price": 80, "duration": 60, "category": "MASSAGE"}}]
+
+If no services found, return: []
+
+Page content:
+{page_text}"""
 
 
-@dataclass
+def _page_text(html: str) -> str:
+    """Get the visible text of an HTML page, one block per line."""
+    if HAS_SELECTOLAX:
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(["script", "style"])
+        root = tree.body or tree.root
+        return root.text(separator="\n") if root else ""
+
+    soup = BeautifulSoup(html, "lxml")
+    for tag in soup(["script", "style"]):
+        tag.decompose()
+    return soup.get_text("\n")
+
+
+@dataclass(slots=True, frozen=True)
 class ExtractedService:
     """Raw extracted service data before normalization."""
     name: str
@@ -25,7 +111,7 @@ class ExtractedService:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MenuScrapeResult:
     """Result of scraping a provider's service menu."""
     success: bool
@@ -41,23 +127,37 @@ class ServiceMenuScraper:
 
     This scraper is designed to be called from the main conversation
     where Playwright MCP is available. It provides the logic for
-    finding menu pages and extracting service data.
+    finding menu pages and extracting service data; scrape() also
+    fetches them itself, over HTTP or in a shared Playwright browser.
     """
 
-    def __init__(self):
+    # Common paths where service menus are found
+    menu_paths: ClassVar[tuple[str, ...]] = (
+        "/services", "/menu", "/pricing", "/prices",
+        "/our-services", "/treatments", "/service-menu",
+        "/massage-services", "/spa-services", "/spa-menu",
+        "/book", "/booking", "/appointments",
+    )
+    # Keywords that indicate a menu/services page
+    menu_keywords: ClassVar[tuple[str, ...]] = (
+        "services", "menu", "pricing", "treatments",
+        "massage", "spa", "book now", "our services",
+    )
+    # Matches an href containing any menu keyword, in one scan
+    _menu_keyword_re: ClassVar[re.Pattern] = re.compile(
+        "|".join(map(re.escape, menu_keywords)), re.IGNORECASE
+    )
+
+    def __init__(self, use_playwright: bool = False):
         self.normalizer = ServiceNormalizer()
-        # Common paths where service menus are found
-        self.menu_paths = [
-            "/services", "/menu", "/pricing", "/prices",
-            "/our-services", "/treatments", "/service-menu",
-            "/massage-services", "/spa-services", "/spa-menu",
-            "/book", "/booking", "/appointments",
-        ]
-        # Keywords that indicate a menu/services page
-        self.menu_keywords = [
-            "services", "menu", "pricing", "treatments",
-            "massage", "spa", "book now", "our services",
-        ]
+        # Render pages in a browser when plain HTTP finds no services.
+        # One browser is launched on first use and shared by every
+        # provider; each page gets its own context, closed afterwards.
+        self.use_playwright = use_playwright and HAS_PLAYWRIGHT
+        self._playwright = None
+        self._browser = None
+        self._browser_lock = asyncio.Lock()
+        self._page_slots = asyncio.Semaphore(MAX_PARALLEL_PAGES)
 
     def find_menu_links(self, page_text: str, base_url: str) -> list[str]:
         """
@@ -70,29 +170,38 @@ class ServiceMenuScraper:
         Returns:
             List of potential menu page URLs
         """
-        links = []
-
-        # Look for href attributes
-        href_pattern = r'href=["\']([^"\']+)["\']'
-        matches = re.findall(href_pattern, page_text, re.IGNORECASE)
+        # Dict keys as an ordered set: first-seen order, O(1) duplicate checks
+        links: dict[str, None] = {}
 
-        for href in matches:
-            href_lower = href.lower()
+        # Look for href attributes, stopping once there are enough
+        for href in self._extract_hrefs(page_text):
             # Check if link contains menu-related keywords
-            if any(kw in href_lower for kw in self.menu_keywords):
-                full_url = urljoin(base_url, href)
-                if full_url not in links:
-                    links.append(full_url)
+            if self._menu_keyword_re.search(href):
+                links[urljoin(base_url, href)] = None
+                if len(links) >= MAX_MENU_LINKS:
+                    return list(links)
 
         # Also try standard menu paths
         parsed = urlparse(base_url)
         base = f"{parsed.scheme}://{parsed.netloc}"
         for path in self.menu_paths:
-            full_url = base + path
-            if full_url not in links:
-                links.append(full_url)
-
-        return links[:10]  # Limit to 10 URLs
+            links[base + path] = None
+            if len(links) >= MAX_MENU_LINKS:
+                break
+
+        return list(links)
+
+    def _extract_hrefs(self, page_text: str) -> Iterator[str]:
+        """Iterate over the href of every link in a page, in page order."""
+        if HAS_SELECTOLAX:
+            try:
+                nodes = LexborHTMLParser(page_text).css("a[href]")
+            except Exception:
+                nodes = None
+            if nodes is not None:
+                return (href for node in nodes if (href := node.attributes["href"]))
+        # Scanned lazily, so a caller that stops early skips the rest
+        return (m.group(1) for m in _HREF_RE.finditer(page_text))
 
     def extract_services_from_text(self, text: str) -> list[ExtractedService]:
         """
@@ -109,12 +218,10 @@ class ServiceMenuScraper:
         """
         services = []
 
-        # Common patterns for service listings
-        # Pattern: "Service Name - $XX" or "Service Name ... $XX"
-        price_pattern = r'([A-Za-z][A-Za-z\s&\'-]+?)[\s\.\-–—]+\$(\d+(?:\.\d{2})?)'
-
-        matches = re.findall(price_pattern, text)
-        for name, price in matches:
+        # Pattern: "Service Name - $XX" or "Service Name ... $XX". Its lazy
+        # name group backtracks at every letter, so skip the pass on pages
+        # with no "$" at all
+        for name, price in _PRICE_RE.findall(text) if "$" in text else ():
             name = name.strip()
             if len(name) > 3 and len(name) < 100:  # Reasonable service name length
                 services.append(ExtractedService(
@@ -122,22 +229,23 @@ class ServiceMenuScraper:
                     price_text=f"${price}",
                 ))
 
-        # Pattern: "XX min/minutes Service Name"
-        duration_pattern = r'(\d+)\s*(?:min|minutes?)\s+([A-Za-z][A-Za-z\s&\'-]+?)(?:\s*[\-–—]\s*\$(\d+))?'
+        # Lowercase names so far, to skip duplicates below
+        seen_names = {s.name.lower() for s in services}
 
-        matches = re.findall(duration_pattern, text, re.IGNORECASE)
-        for duration, name, price in matches:
+        # Pattern: "XX min/minutes Service Name"
+        for duration, name, price in _DURATION_RE.findall(text):
             name = name.strip()
             if len(name) > 3 and len(name) < 100:
-                svc = ExtractedService(
+                # Don't add duplicates
+                name_lower = name.lower()
+                if name_lower in seen_names:
+                    continue
+                seen_names.add(name_lower)
+                services.append(ExtractedService(
                     name=name,
+                    price_text=f"${price}" if price else None,
                     duration_text=f"{duration} min",
-                )
-                if price:
-                    svc.price_text = f"${price}"
-                # Don't add duplicates
-                if not any(s.name.lower() == name.lower() for s in services):
-                    services.append(svc)
+                ))
 
         return services
 
@@ -184,6 +292,106 @@ class ServiceMenuScraper:
 
         return services
 
+    async def scrape(self, client: HttpClient, website_url: str) -> MenuScrapeResult:
+        """
+        Fetch a provider's homepage, then likely menu pages, until one lists services.
+
+        Pages are fetched over HTTP first, then rendered with Playwright if
+        that found nothing and use_playwright is set.
+
+        Args:
+            client: HTTP client (its rate limiter spaces requests per host)
+            website_url: Provider website URL
+
+        Returns:
+            MenuScrapeResult; on failure raw_text holds the homepage text
+            for LLM parsing
+        """
+        result = await self._scrape_pages(lambda url: self._fetch(client, url), website_url)
+        if result.success or not self.use_playwright:
+            return result
+
+        rendered = await self._scrape_pages(self._render, website_url)
+        # On failure keep the HTTP result, unless only the browser got the page
+        if rendered.success or result.raw_text is None:
+            return rendered
+        return result
+
+    async def _scrape_pages(
+        self,
+        fetch: Callable[[str], Awaitable[Optional[str]]],
+        website_url: str,
+    ) -> MenuScrapeResult:
+        """Try the homepage, then its menu links, getting each page with fetch."""
+        home = await fetch(website_url)
+        if home is None:
+            return MenuScrapeResult(success=False, error=f"Could not fetch {website_url}")
+
+        home_text = _page_text(home)
+        menu_urls = [
+            url for url in self.find_menu_links(home, website_url) if url != website_url
+        ]
+
+        for url in [website_url, *menu_urls[:MAX_MENU_PAGES]]:
+            if url == website_url:
+                text = home_text
+            else:
+                html = await fetch(url)
+                if html is None:
+                    continue
+                text = _page_text(html)
+
+            services = self.normalize_services(self.extract_services_from_text(text))
+            if services:
+                return MenuScrapeResult(success=True, services=services, menu_url=url)
+
+        return MenuScrapeResult(success=False, error="No services found", raw_text=home_text)
+
+    async def _fetch(self, client: HttpClient, url: str) -> Optional[str]:
+        """
+        Fetch a page's HTML, or None if it couldn't be fetched.
+
+        Errors are logged and swallowed so one bad page doesn't stop the
+        provider's other pages from being tried.
+        """
+        try:
+            response = await client.get(url)
+        except (HttpError, aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError) as e:
+            print(f"  Could not fetch {url}: {e!r}")
+            return None
+        return response.content if response.ok else None
+
+    async def _get_browser(self):
+        """Get the shared browser, launching it on first use."""
+        async with self._browser_lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+        return self._browser
+
+    async def _render(self, url: str) -> Optional[str]:
+        """Render a page in the shared browser, or None if it failed to load."""
+        browser = await self._get_browser()
+        async with self._page_slots:
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
+                await page.goto(url, wait_until="networkidle", timeout=PAGE_TIMEOUT_MS)
+                return await page.content()
+            except Exception:
+                return None
+            finally:
+                await context.close()
+
+    async def close(self) -> None:
+        """Close the shared browser if it was launched."""
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
     def get_scrape_instructions(self, website_url: str) -> dict:
         """
         Get instructions for scraping a website with Playwright.
@@ -200,14 +408,7 @@ class ServiceMenuScraper:
             "start_url": website_url,
             "menu_paths": self.menu_paths,
             "menu_keywords": self.menu_keywords,
-            "steps": [
-                "1. Navigate to start_url",
-                "2. Take a snapshot to find menu/services links",
-                "3. Click on menu/services link if found",
-                "4. Take snapshot of menu page",
-                "5. Extract all visible service names, prices, durations",
-                "6. Return extracted data for parsing",
-            ],
+            "steps": _SCRAPE_STEPS,
         }
 
 
@@ -222,60 +423,90 @@ def parse_services_with_llm_prompt(page_text: str, provider_name: str) -> str:
     Returns:
         Prompt string for LLM
     """
-    return f"""Extract massage/spa services from this webpage content for "{provider_name}".
+    # Drop scripts/styles and blank lines before truncating, so the budget
+    # goes on visible text (JS-heavy pages can open with KBs of script).
+    # Line breaks are kept; they separate menu rows.
+    if "<" in page_text:
+        page_text = _NOISE_RE.sub("", page_text)
+    lines = (" ".join(line.split()) for line in page_text.splitlines())
+    page_text = "\n".join(line for line in lines if line)
 
-For each service found, extract:
-- name: Service name (e.g., "Swedish Massage", "Deep Tissue 60min")
-- price: Price in dollars (e.g., 80, 120) - just the number
-- duration: Duration in minutes (e.g., 60, 90) - just the number
-- category: One of MASSAGE, ACUPUNCTURE, NAILS, HAIR, FACIALS_AND_SKIN, LASHES_AND_BROWS
-
-Return JSON array only, no explanation:
-[{{"name": "...", "price": 80, "duration": 60, "category": "MASSAGE"}}]
-
-If no services found, return: []
-
-Page content:
-{page_text[:8000]}"""
+    return _LLM_PROMPT.format(
+        provider_name=provider_name,
+        page_text=page_text[:MAX_PROMPT_PAGE_CHARS],
+    )
 
 
 async def scrape_services_for_providers(
     providers: list[dict],
     max_providers: int = 10,
+    max_concurrency: int = MAX_CONCURRENT_PROVIDERS,
+    session: Optional[aiohttp.ClientSession] = None,
+    use_playwright: bool = False,
 ) -> list[dict]:
     """
     Scrape services for a list of providers.
 
-    NOTE: This function provides the framework. Actual Playwright
-    calls should be made from the main conversation where MCP is available.
+    Menus are fetched over plain HTTP, several providers at a time (through
+    the on-disk response cache, so re-runs skip unchanged pages), and
+    optionally rendered in one shared Playwright browser. Providers still
+    without services afterwards are printed with instructions for
+    scraping them with Playwright from the main conversation, where MCP
+    is available.
 
     Args:
         providers: List of provider dicts with websiteUrl
         max_providers: Maximum providers to process
+        max_concurrency: Max providers fetched at once
+        session: Optional shared aiohttp session (e.g. get_shared_session())
+        use_playwright: Render pages HTTP found no services on (needs playwright)
 
     Returns:
         Updated providers list with scraped services
     """
-    scraper = ServiceMenuScraper()
+    scraper = ServiceMenuScraper(use_playwright=use_playwright)
 
-    # Filter providers with websites that need service scraping
-    to_scrape = []
-    for p in providers:
-        if not p.get("websiteUrl"):
-            continue
-        # Check if services are just placeholder
-        services = p.get("services", [])
-        if not services or all(s.get("name") == "Massage" for s in services):
-            to_scrape.append(p)
+    # Filter providers with websites that need service scraping: no
+    # services, or only their category's placeholder (e.g. "Nails")
+    to_scrape = [
+        p for p in providers
+        if p.get("websiteUrl") and not has_scraped_services(p.get("services") or ())
+    ]
 
+    batch = to_scrape[:max_providers]
     print(f"Found {len(to_scrape)} providers needing service scraping")
-    print(f"Processing first {min(len(to_scrape), max_providers)}")
+    print(f"Processing first {len(batch)}")
 
-    # Return instructions for manual Playwright scraping
-    for p in to_scrape[:max_providers]:
-        instructions = scraper.get_scrape_instructions(p["websiteUrl"])
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    try:
+        async with HttpClient(session=session, cache=ResponseCache()) as client:
+            async def scrape_one(p: dict) -> MenuScrapeResult:
+                async with semaphore:
+                    return await scraper.scrape(client, p["websiteUrl"])
+
+            results = await asyncio.gather(
+                *(scrape_one(p) for p in batch),
+                return_exceptions=True,
+            )
+    finally:
+        await scraper.close()
+
+    for p, result in zip(batch, results):
         print(f"\nProvider: {p['name']}")
         print(f"  Website: {p['websiteUrl']}")
+
+        if isinstance(result, Exception):
+            result = MenuScrapeResult(success=False, error=str(result))
+
+        if result.success:
+            p["services"] = [s.to_dict() for s in result.services]
+            print(f"  Found {len(result.services)} services on {result.menu_url}")
+            continue
+
+        # Leave for manual Playwright scraping
+        instructions = scraper.get_scrape_instructions(p["websiteUrl"])
+        print(f"  {result.error}")
         print(f"  Try these paths: {', '.join(instructions['menu_paths'][:5])}")
 
     return providers
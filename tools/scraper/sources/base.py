@@ -4,15 +4,16 @@ Base Source Class
 Abstract base class for all data sources (websites, APIs, directories).
 """
 
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import AsyncIterator, Optional
 
 from ..schemas import ScrapedProvider, SourceType
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceResult:
     """Result from a source fetch operation."""
     provider: Optional[ScrapedProvider] = None
@@ -20,7 +21,13 @@ class SourceResult:
     error: Optional[str] = None
     source_url: str = ""
     source_type: SourceType = SourceType.WEBSITE
-    fetched_at: datetime = field(default_factory=datetime.utcnow)
+    # Unix time; far cheaper to take per result than a datetime
+    fetched_at_ts: float = field(default_factory=time.time)
+
+    @property
+    def fetched_at(self) -> datetime:
+        """When the result was fetched (UTC)."""
+        return datetime.fromtimestamp(self.fetched_at_ts, tz=timezone.utc)
 
     @property
     def success(self) -> bool:
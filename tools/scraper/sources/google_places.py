@@ -4,10 +4,19 @@ Google Places Source
 Fetches provider data from Google Places API.
 """
 
+import asyncio
+import copy
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import replace
 from datetime import datetime
 from typing import AsyncIterator, Optional
+from urllib.parse import urlencode
 
-from ..config import get_settings, RateLimiter
+import aiohttp
+import orjson
+
+from ..config import get_settings, RateLimiter, RATE_LIMITS
 from ..schemas import (
     ScrapedProvider,
     ScrapedService,
@@ -15,10 +24,33 @@ from ..schemas import (
     ServiceCategory,
     SourceType,
 )
-from ..utils import HttpClient, content_hash
+from ..normalizers import PLACEHOLDER_SERVICE_NAMES, category_from_value
+from ..utils import HttpClient, HttpResponse, content_hash
 from .base import BaseSource, SourceResult
 
 
+# Place Details fields we parse (Google bills per field group requested)
+_DETAILS_FIELDS = ",".join((
+    "name",
+    "formatted_address",
+    "address_components",
+    "geometry",
+    "formatted_phone_number",
+    "website",
+    "opening_hours",
+    "rating",
+    "user_ratings_total",
+    "types",
+))
+
+# Successful Place Details lookups kept per source (least recently used
+# evicted first); the same place turns up across queries and categories
+DETAILS_CACHE_SIZE = 10_000
+
+# Backoff between retries of a next_page_token request that Google hasn't
+# activated yet (it answers INVALID_REQUEST for a second or so after issuing)
+_PAGE_TOKEN_RETRY_DELAYS = (0.5, 0.75, 1.0, 1.5, 2.0)
+
 # Mapping from Google place types to OpenSlots categories
 PLACE_TYPE_MAPPING: dict[str, ServiceCategory] = {
     "spa": ServiceCategory.MASSAGE,
@@ -94,6 +126,21 @@ NYC_SEARCH_POINTS: list[tuple[float, float, int]] = [
     (40.8818, -73.8787, 2000),   # Fordham
 ]
 
+_NYC_NAMES = frozenset(("new york city", "nyc", "new york"))
+
+# Every NYC text search per category, neighborhood by neighborhood
+_NYC_QUERY_STRINGS: dict[ServiceCategory, tuple[str, ...]] = {
+    cat: tuple(f"{q} in {loc}, NYC" for loc in NYC_NEIGHBORHOODS for q in qs)
+    for cat, qs in CATEGORY_SEARCH_QUERIES.items()
+}
+
+# Every NYC nearby search per category: (keyword, lat, lng, radius), using
+# each category's top 3 queries at every search point
+_NYC_COORD_QUERIES: dict[ServiceCategory, tuple[tuple[str, float, float, int], ...]] = {
+    cat: tuple((q, lat, lng, radius) for lat, lng, radius in NYC_SEARCH_POINTS for q in qs[:3])
+    for cat, qs in CATEGORY_SEARCH_QUERIES.items()
+}
+
 
 class GooglePlacesSource(BaseSource):
     """
@@ -106,11 +153,48 @@ class GooglePlacesSource(BaseSource):
     - Rate limited to protect API quota
     """
 
-    def __init__(self, rate_limiter: Optional[RateLimiter] = None):
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
         self.settings = get_settings()
         self.rate_limiter = rate_limiter or RateLimiter()
+        self.session = session
         self.api_key = self.settings.google_api_key
         self.base_url = "https://maps.googleapis.com/maps/api/place"
+        self._details_url = f"{self.base_url}/details/json"
+        self._textsearch_url = f"{self.base_url}/textsearch/json"
+        self._nearbysearch_url = f"{self.base_url}/nearbysearch/json"
+        # Bounds in-flight Place Details requests; the rate limiter still
+        # spaces out when each one is actually sent.
+        self._details_semaphore = asyncio.Semaphore(
+            RATE_LIMITS["google_places"].requests_per_minute
+        )
+        self._details_cache: OrderedDict[str, SourceResult] = OrderedDict()
+        self._details_inflight: dict[str, asyncio.Task[SourceResult]] = {}
+        # Set while the source is used as `async with source:`
+        self._client: Optional[HttpClient] = None
+
+    async def __aenter__(self) -> "GooglePlacesSource":
+        """Open one HttpClient that every request of the crawl reuses."""
+        client = HttpClient(rate_limiter=self.rate_limiter, session=self.session)
+        self._client = await client.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        client, self._client = self._client, None
+        if client is not None:
+            await client.__aexit__(exc_type, exc_val, exc_tb)
+
+    @asynccontextmanager
+    async def _http(self) -> AsyncIterator[HttpClient]:
+        """Yield the source's client, or a one-off one outside `async with`."""
+        if self._client is not None:
+            yield self._client
+        else:
+            async with HttpClient(rate_limiter=self.rate_limiter, session=self.session) as client:
+                yield client
 
     @property
     def source_type(self) -> SourceType:
@@ -127,6 +211,10 @@ class GooglePlacesSource(BaseSource):
         """
         Fetch details for a single place by ID.
 
+        Successful lookups are memoized, and concurrent lookups of the same
+        place share one request. Each caller gets its own copy of the
+        provider, so callers may mutate it.
+
         Args:
             place_id: Google Place ID
 
@@ -140,27 +228,46 @@ class GooglePlacesSource(BaseSource):
                 source_type=self.source_type,
             )
 
+        result = self._details_cache.get(place_id)
+        if result is not None:
+            self._details_cache.move_to_end(place_id)
+        else:
+            task = self._details_inflight.get(place_id)
+            if task is None:
+                task = asyncio.create_task(self._fetch_and_cache(place_id))
+                self._details_inflight[place_id] = task
+            # Shielded so one caller giving up doesn't cancel the request for
+            # the others; an abandoned lookup still completes and is cached.
+            result = await asyncio.shield(task)
+
+        if result.provider:
+            return replace(result, provider=copy.deepcopy(result.provider))
+        return result
+
+    async def _fetch_and_cache(self, place_id: str) -> SourceResult:
+        """Fetch a place's details, caching the result if it succeeded."""
         try:
-            async with HttpClient(rate_limiter=self.rate_limiter) as client:
-                url = f"{self.base_url}/details/json"
+            result = await self._fetch_place(place_id)
+        finally:
+            del self._details_inflight[place_id]
+
+        if result.success:
+            self._details_cache[place_id] = result
+            if len(self._details_cache) > DETAILS_CACHE_SIZE:
+                self._details_cache.popitem(last=False)
+        return result
+
+    async def _fetch_place(self, place_id: str) -> SourceResult:
+        """Request a place's details from the API."""
+        try:
+            async with self._http() as client:
                 params = {
                     "place_id": place_id,
                     "key": self.api_key,
-                    "fields": ",".join([
-                        "name",
-                        "formatted_address",
-                        "address_components",
-                        "geometry",
-                        "formatted_phone_number",
-                        "website",
-                        "opening_hours",
-                        "rating",
-                        "user_ratings_total",
-                        "types",
-                    ]),
+                    "fields": _DETAILS_FIELDS,
                 }
 
-                full_url = f"{url}?{'&'.join(f'{k}={v}' for k, v in params.items())}"
+                full_url = f"{self._details_url}?{urlencode(params)}"
                 response = await client.get(full_url, source_type="google_places")
 
                 if not response.ok:
@@ -170,8 +277,7 @@ class GooglePlacesSource(BaseSource):
                         source_type=self.source_type,
                     )
 
-                import json
-                data = json.loads(response.content)
+                data = orjson.loads(response.content)
 
                 if data.get("status") != "OK":
                     return SourceResult(
@@ -214,7 +320,7 @@ class GooglePlacesSource(BaseSource):
     async def search(
         self,
         city: str,
-        category: str,
+        category: ServiceCategory | str,
         **kwargs,
     ) -> AsyncIterator[SourceResult]:
         """
@@ -222,7 +328,7 @@ class GooglePlacesSource(BaseSource):
 
         Args:
             city: City name to search
-            category: Service category (e.g., "MASSAGE")
+            category: ServiceCategory, or its value (e.g., "MASSAGE")
             **kwargs: Additional parameters (max_results, etc.)
 
         Yields:
@@ -240,7 +346,7 @@ class GooglePlacesSource(BaseSource):
 
         # Get search queries for this category
         try:
-            cat = ServiceCategory(category)
+            cat = category if isinstance(category, ServiceCategory) else category_from_value(category)
         except ValueError:
             yield SourceResult(
                 error=f"Invalid category: {category}",
@@ -249,52 +355,46 @@ class GooglePlacesSource(BaseSource):
             )
             return
 
-        queries = CATEGORY_SEARCH_QUERIES.get(cat, [cat.value.lower()])
         results_count = 0
         seen_place_ids: set[str] = set()
 
         # Determine locations to search
-        is_nyc = city.lower() in ["new york city", "nyc", "new york"]
+        is_nyc = city.lower() in _NYC_NAMES
         use_coordinates = kwargs.get("use_coordinates", True) and is_nyc
 
         # Phase 1: Text-based neighborhood searches
-        locations = NYC_NEIGHBORHOODS if is_nyc else [city]
+        if is_nyc:
+            search_queries = _NYC_QUERY_STRINGS[cat]
+        else:
+            queries = CATEGORY_SEARCH_QUERIES.get(cat, [cat.value.lower()])
+            search_queries = [f"{query} in {city}" for query in queries]
 
-        for location in locations:
+        for search_query in search_queries:
             if results_count >= max_results:
                 break
 
-            for query in queries:
+            async for result in self._text_search(search_query, cat, max_results - results_count, seen_place_ids):
+                yield result
+                if result.success:
+                    results_count += 1
                 if results_count >= max_results:
                     break
 
-                search_query = f"{query} in {location}, NYC" if is_nyc else f"{query} in {city}"
-                async for result in self._text_search(search_query, cat, max_results - results_count, seen_place_ids):
-                    yield result
-                    if result.success:
-                        results_count += 1
-                    if results_count >= max_results:
-                        break
-
         # Phase 2: Coordinate-based nearby searches (for dense NYC coverage)
-        if use_coordinates and results_count < max_results:
-            for lat, lng, radius in NYC_SEARCH_POINTS:
+        if use_coordinates:
+            for query, lat, lng, radius in _NYC_COORD_QUERIES[cat]:
                 if results_count >= max_results:
                     break
 
-                for query in queries[:3]:  # Use top 3 queries for coordinate searches
+                async for result in self._nearby_search(
+                    query, lat, lng, radius, cat, max_results - results_count, seen_place_ids
+                ):
+                    yield result
+                    if result.success:
+                        results_count += 1
                     if results_count >= max_results:
                         break
 
-                    async for result in self._nearby_search(
-                        query, lat, lng, radius, cat, max_results - results_count, seen_place_ids
-                    ):
-                        yield result
-                        if result.success:
-                            results_count += 1
-                        if results_count >= max_results:
-                            break
-
     async def _text_search(
         self,
         query: str,
@@ -307,8 +407,7 @@ class GooglePlacesSource(BaseSource):
             seen_place_ids = set()
 
         try:
-            async with HttpClient(rate_limiter=self.rate_limiter) as client:
-                url = f"{self.base_url}/textsearch/json"
+            async with self._http() as client:
                 params = {
                     "query": query,
                     "key": self.api_key,
@@ -322,10 +421,12 @@ class GooglePlacesSource(BaseSource):
                     if next_page_token:
                         params["pagetoken"] = next_page_token
 
-                    full_url = f"{url}?{'&'.join(f'{k}={v}' for k, v in params.items())}"
-                    response = await client.get(full_url, source_type="google_places")
+                    full_url = f"{self._textsearch_url}?{urlencode(params)}"
+                    response, data = await self._get_results_page(
+                        client, full_url, paged=next_page_token is not None
+                    )
 
-                    if not response.ok:
+                    if data is None:
                         yield SourceResult(
                             error=f"Search failed: HTTP {response.status}",
                             source_url=full_url,
@@ -333,14 +434,10 @@ class GooglePlacesSource(BaseSource):
                         )
                         return
 
-                    import json
-                    data = json.loads(response.content)
-
                     status = data.get("status")
                     if status not in ["OK", "ZERO_RESULTS"]:
                         # Handle rate limiting with backoff
                         if status in ["OVER_QUERY_LIMIT", "REQUEST_DENIED"]:
-                            import asyncio
                             await asyncio.sleep(5)  # Wait and continue to next query
                         yield SourceResult(
                             error=f"Search error: {status}",
@@ -349,10 +446,11 @@ class GooglePlacesSource(BaseSource):
                         )
                         return
 
-                    # Process results
+                    # Collect unseen places on this page
+                    new_place_ids = []
                     for place in data.get("results", []):
-                        if results_yielded >= max_results:
-                            return
+                        if results_yielded + len(new_place_ids) >= max_results:
+                            break
 
                         place_id = place.get("place_id")
                         if place_id:
@@ -360,29 +458,21 @@ class GooglePlacesSource(BaseSource):
                             if place_id in seen_place_ids:
                                 continue
                             seen_place_ids.add(place_id)
+                            new_place_ids.append(place_id)
 
-                            # Fetch full details
-                            result = await self.fetch(place_id)
-
-                            # Add category-based service if we have a provider
-                            if result.provider and not result.provider.services:
-                                result.provider.services.append(ScrapedService(
-                                    category=category,
-                                    name=category.value.replace("_", " ").title(),
-                                ))
+                    # Fetch full details concurrently
+                    async for result in self._fetch_details(new_place_ids, category):
+                        yield result
+                        results_yielded += 1
 
-                            yield result
-                            results_yielded += 1
+                    if results_yielded >= max_results:
+                        return
 
                     # Check for more pages
                     next_page_token = data.get("next_page_token")
                     if not next_page_token:
                         break
 
-                    # Google requires delay before using page token
-                    import asyncio
-                    await asyncio.sleep(2)
-
         except Exception as e:
             yield SourceResult(
                 error=str(e),
@@ -405,8 +495,7 @@ class GooglePlacesSource(BaseSource):
             seen_place_ids = set()
 
         try:
-            async with HttpClient(rate_limiter=self.rate_limiter) as client:
-                url = f"{self.base_url}/nearbysearch/json"
+            async with self._http() as client:
                 params = {
                     "location": f"{lat},{lng}",
                     "radius": str(radius),
@@ -422,10 +511,12 @@ class GooglePlacesSource(BaseSource):
                     if next_page_token:
                         params["pagetoken"] = next_page_token
 
-                    full_url = f"{url}?{'&'.join(f'{k}={v}' for k, v in params.items())}"
-                    response = await client.get(full_url, source_type="google_places")
+                    full_url = f"{self._nearbysearch_url}?{urlencode(params)}"
+                    response, data = await self._get_results_page(
+                        client, full_url, paged=next_page_token is not None
+                    )
 
-                    if not response.ok:
+                    if data is None:
                         yield SourceResult(
                             error=f"Nearby search failed: HTTP {response.status}",
                             source_url=full_url,
@@ -433,14 +524,10 @@ class GooglePlacesSource(BaseSource):
                         )
                         return
 
-                    import json
-                    data = json.loads(response.content)
-
                     status = data.get("status")
                     if status not in ["OK", "ZERO_RESULTS"]:
                         # Handle rate limiting with backoff
                         if status in ["OVER_QUERY_LIMIT", "REQUEST_DENIED"]:
-                            import asyncio
                             await asyncio.sleep(5)
                         yield SourceResult(
                             error=f"Nearby search error: {status}",
@@ -449,10 +536,11 @@ class GooglePlacesSource(BaseSource):
                         )
                         return
 
-                    # Process results
+                    # Collect unseen places on this page
+                    new_place_ids = []
                     for place in data.get("results", []):
-                        if results_yielded >= max_results:
-                            return
+                        if results_yielded + len(new_place_ids) >= max_results:
+                            break
 
                         place_id = place.get("place_id")
                         if place_id:
@@ -460,29 +548,21 @@ class GooglePlacesSource(BaseSource):
                             if place_id in seen_place_ids:
                                 continue
                             seen_place_ids.add(place_id)
+                            new_place_ids.append(place_id)
 
-                            # Fetch full details
-                            result = await self.fetch(place_id)
-
-                            # Add category-based service if we have a provider
-                            if result.provider and not result.provider.services:
-                                result.provider.services.append(ScrapedService(
-                                    category=category,
-                                    name=category.value.replace("_", " ").title(),
-                                ))
+                    # Fetch full details concurrently
+                    async for result in self._fetch_details(new_place_ids, category):
+                        yield result
+                        results_yielded += 1
 
-                            yield result
-                            results_yielded += 1
+                    if results_yielded >= max_results:
+                        return
 
                     # Check for more pages
                     next_page_token = data.get("next_page_token")
                     if not next_page_token:
                         break
 
-                    # Google requires delay before using page token
-                    import asyncio
-                    await asyncio.sleep(2)
-
         except Exception as e:
             yield SourceResult(
                 error=str(e),
@@ -490,6 +570,69 @@ class GooglePlacesSource(BaseSource):
                 source_type=self.source_type,
             )
 
+    async def _get_results_page(
+        self,
+        client: HttpClient,
+        full_url: str,
+        paged: bool,
+    ) -> tuple[HttpResponse, Optional[dict]]:
+        """
+        Fetch one page of search results.
+
+        A page token is requested as soon as it's issued and retried with
+        short backoff while Google still reports INVALID_REQUEST, rather
+        than always sleeping 2s first.
+
+        Returns:
+            (response, parsed JSON), with None for the JSON if not HTTP OK
+        """
+        delays = _PAGE_TOKEN_RETRY_DELAYS if paged else ()
+        for delay in (*delays, None):
+            response = await client.get(full_url, source_type="google_places")
+            if not response.ok:
+                return response, None
+
+            data = orjson.loads(response.content)
+            if delay is None or data.get("status") != "INVALID_REQUEST":
+                return response, data
+
+            await asyncio.sleep(delay)
+
+    async def _fetch_details(
+        self,
+        place_ids: list[str],
+        category: ServiceCategory,
+    ) -> AsyncIterator[SourceResult]:
+        """
+        Fetch details for several places concurrently.
+
+        Results are yielded in place_ids order, each as soon as it and the
+        ones before it are done, so callers can process early results
+        while later fetches are still in flight.
+        """
+
+        async def fetch_one(place_id: str) -> SourceResult:
+            async with self._details_semaphore:
+                result = await self.fetch(place_id)
+
+            # Add category-based service if we have a provider
+            if result.provider and not result.provider.services:
+                result.provider.services.append(ScrapedService(
+                    category=category,
+                    name=PLACEHOLDER_SERVICE_NAMES[category],
+                ))
+
+            return result
+
+        tasks = [asyncio.create_task(fetch_one(place_id)) for place_id in place_ids]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            # Don't leave fetches running if the caller stops early
+            for task in tasks:
+                task.cancel()
+
     def _parse_place_details(self, place: dict) -> Optional[ScrapedProvider]:
         """Parse Google Places API response into ScrapedProvider."""
         name = place.get("name")
@@ -536,7 +679,7 @@ class GooglePlacesSource(BaseSource):
             google_review_count=place.get("user_ratings_total"),
             services=[ScrapedService(
                 category=category,
-                name=category.value.replace("_", " ").title(),
+                name=PLACEHOLDER_SERVICE_NAMES[category],
             )],
             confidence=0.95,  # High confidence for Google data
         )
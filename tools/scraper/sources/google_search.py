@@ -4,6 +4,7 @@ Google Custom Search Source
 Finds provider websites using Google Custom Search API.
 """
 
+import asyncio
 import os
 from typing import Optional
 from dotenv import load_dotenv
@@ -11,27 +12,65 @@ from dotenv import load_dotenv
 import aiohttp
 
 from ..config import get_settings, RateLimiter
+from ..utils.http import create_session
 
 # Load environment variables
 load_dotenv()
 
+# Skip these domains - they're directories, not provider sites
+_SKIP_DOMAINS: tuple[str, ...] = (
+    "yelp.com", "facebook.com", "instagram.com", "twitter.com",
+    "linkedin.com", "yellowpages.com", "tripadvisor.com",
+    "google.com", "mapquest.com", "bbb.org", "manta.com",
+)
+# Website lookups in flight at once; the rate limiter still spaces them out
+MAX_CONCURRENT_SEARCHES = 10
+
+_SKIP_SUFFIXES = tuple(f".{domain}" for domain in _SKIP_DOMAINS)
+
+
+def _is_directory(host: str) -> bool:
+    """Whether host is a skipped domain or a subdomain of one (not "notgoogle.com")."""
+    return f".{host}".endswith(_SKIP_SUFFIXES)
+
 
 class GoogleSearchSource:
     """
     Finds provider websites using Google Custom Search API.
 
     Usage:
-        search = GoogleSearchSource()
-        url = await search.find_website("Renew Day Spa", "New York", "NY")
+        async with GoogleSearchSource() as search:
+            url = await search.find_website("Renew Day Spa", "New York", "NY")
+
+    Inside `async with` every lookup reuses one keep-alive session (the one
+    passed in, or one the source opens and closes itself).
     """
 
-    def __init__(self, rate_limiter: Optional[RateLimiter] = None):
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
         self.settings = get_settings()
         self.rate_limiter = rate_limiter or RateLimiter()
+        self.session = session
+        self._owns_session = False
         self.api_key = os.getenv("GOOGLE_SEARCH_API_KEY", "")
         self.search_engine_id = os.getenv("GOOGLE_SEARCH_ENGINE_ID", "")
         self.base_url = "https://www.googleapis.com/customsearch/v1"
 
+    async def __aenter__(self) -> "GoogleSearchSource":
+        if self.session is None:
+            self.session = create_session()
+            self._owns_session = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._owns_session and self.session:
+            await self.session.close()
+            self.session = None
+            self._owns_session = False
+
     @property
     def is_enabled(self) -> bool:
         return bool(self.api_key and self.search_engine_id)
@@ -62,78 +101,83 @@ class GoogleSearchSource:
         try:
             await self.rate_limiter.acquire("google_search", "googleapis.com")
 
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "key": self.api_key,
-                    "cx": self.search_engine_id,
-                    "q": query,
-                    "num": 5,  # Get top 5 results
-                }
+            params = {
+                "key": self.api_key,
+                "cx": self.search_engine_id,
+                "q": query,
+                "num": 5,  # Get top 5 results
+            }
 
-                async with session.get(self.base_url, params=params) as resp:
-                    if resp.status != 200:
-                        self.rate_limiter.record_failure("googleapis.com")
-                        return None
+            if self.session is None:
+                # Used outside `async with`; fall back to a one-off session
+                async with aiohttp.ClientSession() as session:
+                    data = await self._get_json(session, params)
+            else:
+                data = await self._get_json(self.session, params)
 
-                    data = await resp.json()
-                    self.rate_limiter.record_success("googleapis.com")
+            if data is None:
+                return None
 
-                    # Find best matching result
-                    return self._extract_best_url(data, provider_name)
+            # Find best matching result
+            return self._extract_best_url(data, provider_name)
 
         except Exception as e:
             print(f"Google Search error: {e}")
             return None
 
+    async def _get_json(self, session: aiohttp.ClientSession, params: dict) -> Optional[dict]:
+        """Run one search request, recording the outcome with the rate limiter."""
+        async with session.get(self.base_url, params=params) as resp:
+            if resp.status != 200:
+                self.rate_limiter.record_failure("googleapis.com")
+                return None
+
+            data = await resp.json()
+            self.rate_limiter.record_success("googleapis.com")
+            return data
+
     def _extract_best_url(self, data: dict, provider_name: str) -> Optional[str]:
         """Extract the most likely provider website from search results."""
         items = data.get("items", [])
         if not items:
             return None
 
-        # Normalize provider name for matching
-        name_lower = provider_name.lower()
-        name_words = set(name_lower.split())
-
-        # Skip these domains - they're directories, not provider sites
-        skip_domains = {
-            "yelp.com", "facebook.com", "instagram.com", "twitter.com",
-            "linkedin.com", "yellowpages.com", "tripadvisor.com",
-            "google.com", "mapquest.com", "bbb.org", "manta.com",
-        }
+        # Distinctive words of the provider name, for matching
+        name_words = {word for word in provider_name.lower().split() if len(word) > 3}
 
+        # Skip directory sites
+        candidates = []
         for item in items:
-            url = item.get("link", "")
             display_link = item.get("displayLink", "").lower()
+            if not _is_directory(display_link):
+                candidates.append((item, display_link))
 
-            # Skip directory sites
-            if any(skip in display_link for skip in skip_domains):
-                continue
-
+        for item, display_link in candidates:
             # Prefer URLs that contain provider name words
             title = item.get("title", "").lower()
-            if any(word in title or word in display_link for word in name_words if len(word) > 3):
-                return url
+            if any(word in title or word in display_link for word in name_words):
+                return item.get("link", "")
 
         # Fallback: return first non-directory result
-        for item in items:
-            url = item.get("link", "")
-            display_link = item.get("displayLink", "").lower()
-            if not any(skip in display_link for skip in skip_domains):
-                return url
+        if candidates:
+            return candidates[0][0].get("link", "")
 
         return None
 
 
-async def find_missing_websites(providers: list[dict]) -> list[dict]:
+async def find_missing_websites(
+    providers: list[dict],
+    max_concurrency: int = MAX_CONCURRENT_SEARCHES,
+) -> list[dict]:
     """
     Find websites for providers missing websiteUrl.
 
     Args:
         providers: List of provider dicts
+        max_concurrency: Max lookups in flight at once
 
     Returns:
-        Updated providers list with found websites
+        Updated providers list with found websites (in input order)
     """
     search = GoogleSearchSource()
 
@@ -141,20 +185,21 @@ async def find_missing_websites(providers: list[dict]) -> list[dict]:
         print("Google Search API not configured, skipping website discovery")
         return providers
 
-    updated = []
+    semaphore = asyncio.Semaphore(max_concurrency)
     found_count = 0
 
-    for provider in providers:
+    async def find_one(provider: dict) -> dict:
+        nonlocal found_count
         if provider.get("websiteUrl"):
-            updated.append(provider)
-            continue
+            return provider
 
         # Try to find website
-        url = await search.find_website(
-            provider["name"],
-            provider["city"],
-            provider["state"],
-        )
+        async with semaphore:
+            url = await search.find_website(
+                provider["name"],
+                provider["city"],
+                provider["state"],
+            )
 
         if url:
             provider["websiteUrl"] = url
@@ -162,7 +207,10 @@ async def find_missing_websites(providers: list[dict]) -> list[dict]:
             found_count += 1
             print(f"  Found website for {provider['name']}: {url}")
 
-        updated.append(provider)
+        return provider
+
+    async with search:
+        updated = list(await asyncio.gather(*(find_one(p) for p in providers)))
 
     print(f"Found websites for {found_count} providers missing URLs")
     return updated
@@ -7,6 +7,8 @@ Scrapes provider data directly from business websites.
 from datetime import datetime
 from typing import AsyncIterator, Optional
 
+import aiohttp
+
 from ..config import get_settings, RateLimiter
 from ..schemas import (
     ScrapedProvider,
@@ -15,7 +17,7 @@ from ..schemas import (
     ServiceCategory,
     SourceType,
 )
-from ..utils import HttpClient, RobotsChecker, content_hash
+from ..utils import HttpClient, ResponseCache, RobotsChecker, content_hash
 from .base import BaseSource, SourceResult
 
 
@@ -41,10 +43,13 @@ class WebsiteSource(BaseSource):
         self,
         rate_limiter: Optional[RateLimiter] = None,
         robots_checker: Optional[RobotsChecker] = None,
+        session: Optional[aiohttp.ClientSession] = None,
     ):
         self.settings = get_settings()
         self.rate_limiter = rate_limiter or RateLimiter()
         self.robots_checker = robots_checker or RobotsChecker()
+        self.session = session
+        self.response_cache = ResponseCache()
 
     @property
     def source_type(self) -> SourceType:
@@ -76,7 +81,11 @@ class WebsiteSource(BaseSource):
             )
 
         try:
-            async with HttpClient(rate_limiter=self.rate_limiter) as client:
+            async with HttpClient(
+                rate_limiter=self.rate_limiter,
+                session=self.session,
+                cache=self.response_cache,
+            ) as client:
                 response = await client.get(url, source_type="website")
 
                 if not response.ok:
@@ -1,9 +1,10 @@
 """Scraper storage modules."""
 
-from .json_store import JsonStore
+from .json_store import JsonStore, NdjsonWriter
 from .token_tracker import TokenTracker
 
 __all__ = [
     "JsonStore",
+    "NdjsonWriter",
     "TokenTracker",
 ]
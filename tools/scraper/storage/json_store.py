@@ -4,21 +4,78 @@ JSON Storage
 Stores scraped provider data to JSON files.
 """
 
-import json
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
+
+import orjson
 
 from ..config import get_settings
 from ..schemas import ScrapedProvider, ScrapeRunStats
 
 
+class NdjsonWriter:
+    """
+    Append-only newline-delimited JSON writer for providers.
+
+    Lines are buffered in memory and flushed to disk every flush_every
+    records or flush_interval seconds, whichever comes first. A crashed
+    run loses at most that much progress, and the scrape loop isn't
+    doing a write syscall per provider.
+
+    Usage:
+        with store.open_ndjson("Miami", "MASSAGE") as writer:
+            writer.write(provider)
+    """
+
+    def __init__(self, path: Path, flush_every: int = 50, flush_interval: float = 5.0):
+        self.path = path
+        self.count = 0
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._buffer: list[bytes] = []
+        self._last_flush = time.monotonic()
+        self._file: BinaryIO = open(path, "wb")
+
+    def write(self, provider: ScrapedProvider) -> None:
+        """Append one provider as a single JSON line."""
+        self._buffer.append(orjson.dumps(provider.to_dict()))
+        self.count += 1
+        if (
+            len(self._buffer) >= self.flush_every
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered lines to disk in one call."""
+        if self._buffer:
+            self._buffer.append(b"")  # Trailing newline
+            self._file.write(b"\n".join(self._buffer))
+            self._file.flush()
+            self._buffer.clear()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush and close the underlying file."""
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> "NdjsonWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 class JsonStore:
     """
     Stores scraped data to JSON files.
 
     File structure:
     - output/providers/{city}_{category}_{timestamp}.json
+    - output/providers/{city}_{category}_{timestamp}.ndjson (streamed during a run)
     - output/runs/{run_id}.json
     """
 
@@ -40,6 +97,20 @@ class JsonStore:
         filename = f"{safe_city}_{safe_category}_{timestamp}.json"
         return self.output_dir / "providers" / filename
 
+    def open_ndjson(self, city: str, category: str) -> NdjsonWriter:
+        """
+        Open an NDJSON file for streaming providers while scraping.
+
+        Args:
+            city: City name
+            category: Service category
+
+        Returns:
+            NdjsonWriter (use as a context manager)
+        """
+        path = self._get_providers_path(city, category).with_suffix(".ndjson")
+        return NdjsonWriter(path)
+
     def _get_run_path(self, run_id: str) -> Path:
         """Get path for run stats file."""
         return self.output_dir / "runs" / f"{run_id}.json"
@@ -73,7 +144,7 @@ class JsonStore:
             "providers": [p.to_dict() for p in providers],
         }
 
-        path.write_text(json.dumps(data, indent=2))
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         return path
 
     def save_run_stats(self, stats: ScrapeRunStats) -> Path:
@@ -87,7 +158,7 @@ class JsonStore:
             Path to saved file
         """
         path = self._get_run_path(stats.run_id)
-        path.write_text(json.dumps(stats.to_dict(), indent=2))
+        path.write_bytes(orjson.dumps(stats.to_dict(), option=orjson.OPT_INDENT_2))
         return path
 
     def load_providers(self, path: Path) -> list[ScrapedProvider]:
@@ -100,7 +171,7 @@ class JsonStore:
         Returns:
             List of providers
         """
-        data = json.loads(path.read_text())
+        data = orjson.loads(path.read_bytes())
         providers = []
 
         for p_data in data.get("providers", []):
@@ -149,7 +220,7 @@ class JsonStore:
         if not files:
             return None
 
-        data = json.loads(files[0].read_text())
+        data = orjson.loads(files[0].read_bytes())
 
         return ScrapeRunStats(
             run_id=data["runId"],
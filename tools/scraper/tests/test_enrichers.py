@@ -0,0 +1,36 @@
+"""Tests for scraper enrichers."""
+
+import pytest
+
+from scraper.enrichers import website_enricher
+from scraper.enrichers.website_enricher import WebsiteEnricher
+
+
+SERVICE_TABLE_HTML = """<html><body><table>
+<tr><td>Swedish Massage</td>
+    <td>60 min</td></tr>
+</table>
+<div>Deep Tissue Massage</div>
+<div>
+  $120 - 90 min
+</div></body></html>"""
+
+
+class TestWebsiteEnricher:
+    """Tests for WebsiteEnricher."""
+
+    def test_parsers_extract_same_services(self, monkeypatch):
+        """Test selectolax and BeautifulSoup give the same services for a page."""
+        pytest.importorskip("selectolax")
+        enricher = WebsiteEnricher()
+
+        def extract(use_selectolax: bool) -> list[tuple]:
+            monkeypatch.setattr(website_enricher, "HAS_SELECTOLAX", use_selectolax)
+            return [
+                (s.name, s.price_cents, s.duration_min)
+                for s in enricher._extract_services(SERVICE_TABLE_HTML, "https://example.com")
+            ]
+
+        expected = [("Swedish Massage", None, 60), ("Deep Tissue Massage", 12000, 90)]
+        assert extract(True) == expected
+        assert extract(False) == expected
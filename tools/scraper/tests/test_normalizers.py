@@ -1,14 +1,23 @@
 """Tests for scraper normalizers."""
 
 import pytest
-
-from scraper.schemas import ScrapedProvider, ScrapedService, ServiceCategory
+from datetime import datetime
+
+from scraper.schemas import (
+    ScrapedProvider,
+    ScrapedService,
+    ScrapedSource,
+    ServiceCategory,
+    SourceType,
+)
 from scraper.normalizers import (
     ProviderNormalizer,
     ServiceNormalizer,
     categorize_service,
     Deduplicator,
+    has_scraped_services,
 )
+from scraper.sources import GooglePlacesSource
 
 
 class TestProviderNormalizer:
@@ -27,6 +36,12 @@ class TestProviderNormalizer:
         result = normalizer.normalize(provider)
         assert result.name == "Amazing Spa"
 
+    def test_normalize_name_removes_chained_suffixes(self):
+        """Test "- Home", legal and "| City" suffixes are all removed."""
+        normalizer = ProviderNormalizer()
+        assert normalizer._normalize_name("Amazing Spa - Home, LLC.") == "Amazing Spa"
+        assert normalizer._normalize_name("Amazing Spa Inc | Miami") == "Amazing Spa Inc"
+
     def test_normalize_name_title_case(self):
         """Test that names are title cased."""
         normalizer = ProviderNormalizer()
@@ -81,6 +96,65 @@ class TestProviderNormalizer:
         result = normalizer.normalize(provider)
         assert result.website_url == "https://example.com"
 
+    def test_normalize_batch(self):
+        """Test batch normalization matches per-provider normalization."""
+        normalizer = ProviderNormalizer()
+        providers = [
+            ScrapedProvider(
+                name="AMAZING SPA LLC",
+                address="123 Main Street",
+                city="miami  beach",
+                state="Florida",
+                zip_code="33139",
+            ),
+            ScrapedProvider(
+                name="Test Spa",
+                address="456 Other St",
+                city="miami  beach",
+                state="FL",
+                zip_code="33139",
+            ),
+        ]
+        results = normalizer.normalize_batch(providers)
+        assert [p.name for p in results] == ["Amazing Spa", "Test Spa"]
+        assert [p.city for p in results] == ["Miami Beach", "Miami Beach"]
+        assert [p.state for p in results] == ["FL", "FL"]
+
+    def test_merge_prefers_higher_priority_source(self):
+        """Test merge uses the Google Maps record as base over a website one."""
+        normalizer = ProviderNormalizer()
+
+        def source(source_type: SourceType) -> ScrapedSource:
+            return ScrapedSource(
+                type=source_type,
+                url="https://example.com",
+                fetched_at=datetime.utcnow(),
+                raw_data_hash="abc123",
+            )
+
+        existing = ScrapedProvider(
+            name="Amazing Spa Website",
+            address="123 Main St",
+            city="Miami",
+            state="FL",
+            zip_code="33101",
+            phone="+13051234567",
+            sources=[source(SourceType.WEBSITE)],
+        )
+        new = ScrapedProvider(
+            name="Amazing Spa",
+            address="123 Main St",
+            city="Miami",
+            state="FL",
+            zip_code="33101",
+            sources=[source(SourceType.GOOGLE_MAPS)],
+        )
+
+        merged = normalizer.merge(existing, new)
+        assert merged.name == "Amazing Spa"
+        assert merged.phone == "+13051234567"
+        assert len(merged.sources) == 2
+
 
 class TestServiceNormalizer:
     """Tests for ServiceNormalizer."""
@@ -149,11 +223,36 @@ class TestCategorizeService:
         assert categorize_service("Acupuncture Session") == ServiceCategory.ACUPUNCTURE
         assert categorize_service("Cupping Therapy") == ServiceCategory.ACUPUNCTURE
 
+    def test_categorize_ignores_keywords_inside_words(self):
+        """Test "hair" in "chairside" doesn't count toward hair."""
+        assert categorize_service("Chairside Facial") == ServiceCategory.FACIALS_AND_SKIN
+
     def test_categorize_default(self):
         """Test unknown services default to massage."""
         assert categorize_service("Unknown Service XYZ") == ServiceCategory.MASSAGE
 
 
+class TestHasScrapedServices:
+    """Tests for has_scraped_services function."""
+
+    def test_search_output_has_only_placeholder(self):
+        """Test a provider straight from Places search still needs scraping."""
+        provider = GooglePlacesSource()._parse_place_details({
+            "name": "Amazing Spa",
+            "formatted_address": "123 Main St, Miami, FL 33101",
+            "types": ["spa", "establishment"],
+        })
+        services = [s.to_dict() for s in provider.services]
+        assert services
+        assert has_scraped_services(services) is False
+
+    def test_scraped_service_counts(self):
+        """Test one real service marks the provider as scraped."""
+        services = [{"name": "Massage"}, {"name": "60 Min Swedish Massage"}]
+        assert has_scraped_services(services) is True
+        assert has_scraped_services([]) is False
+
+
 class TestDeduplicator:
     """Tests for Deduplicator."""
 
@@ -228,7 +327,7 @@ class TestDeduplicator:
         """Test finding potential duplicates."""
         dedup = Deduplicator()
         provider1 = ScrapedProvider(
-            name="Amazing Spa",
+            name="Amazing Spa & Wellness Center",
             address="123 Main St",
             city="Miami",
             state="FL",
@@ -239,7 +338,7 @@ class TestDeduplicator:
 
         # Search for potential duplicates
         provider2 = ScrapedProvider(
-            name="Amazing Spa & Wellness",
+            name="The Amazing Spa & Wellness Center",
             address="456 Other St",
             city="Miami",
             state="FL",
@@ -249,3 +348,45 @@ class TestDeduplicator:
         matches = dedup.find_duplicates(provider2)
         assert len(matches) > 0
         assert matches[0].match_reasons == ["fuzzy_name"]
+
+    def test_find_duplicates_subset_name(self):
+        """Test a name contained in a longer one isn't a fuzzy match by itself."""
+        dedup = Deduplicator()
+        dedup.add(ScrapedProvider(
+            name="Elite Massage Studio",
+            address="123 Main St",
+            city="Miami",
+            state="FL",
+            zip_code="33101",
+        ))
+
+        provider = ScrapedProvider(
+            name="Massage",
+            address="456 Other St",
+            city="Miami",
+            state="FL",
+            zip_code="33102",
+        )
+
+        assert dedup.find_duplicates(provider) == []
+
+    def test_find_duplicates_unrelated_name(self):
+        """Test a name sharing no tokens with indexed providers has no fuzzy match."""
+        dedup = Deduplicator()
+        dedup.add(ScrapedProvider(
+            name="Amazing Spa",
+            address="123 Main St",
+            city="Miami",
+            state="FL",
+            zip_code="33101",
+        ))
+
+        provider = ScrapedProvider(
+            name="Downtown Nails",
+            address="456 Other St",
+            city="Miami",
+            state="FL",
+            zip_code="33102",
+        )
+
+        assert dedup.find_duplicates(provider) == []
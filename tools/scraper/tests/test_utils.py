@@ -9,6 +9,9 @@ from scraper.utils.hash import (
     normalize_address,
     generate_provider_key,
 )
+from scraper.utils.cache import ResponseCache
+from scraper.config import rate_limits
+from scraper.config.rate_limits import RateLimiter
 
 
 class TestContentHash:
@@ -131,3 +134,95 @@ class TestGenerateProviderKey:
         key1 = generate_provider_key("Test Spa", "123 Main St", "Miami")
         key2 = generate_provider_key("Other Spa", "456 Oak Ave", "Miami")
         assert key1 != key2
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_miss(self, tmp_path):
+        """Test unknown URL is a miss."""
+        cache = ResponseCache(cache_dir=tmp_path)
+        assert cache.lookup("https://example.com") == (None, False)
+
+    def test_store_and_revalidate(self, tmp_path):
+        """Test stored entry is fresh, then revalidated once stale."""
+        cache = ResponseCache(cache_dir=tmp_path)
+        cache.store("https://example.com", "<html>", {"ETag": '"abc"'})
+        entry, fresh = cache.lookup("https://example.com")
+        assert fresh and entry["content"] == "<html>"
+
+        cache.ttl_seconds = 0
+        entry, fresh = cache.lookup("https://example.com")
+        assert not fresh
+        assert cache.conditional_headers(entry) == {"If-None-Match": '"abc"'}
+
+    def test_no_store(self, tmp_path):
+        """Test Cache-Control: no-store responses are not cached."""
+        cache = ResponseCache(cache_dir=tmp_path)
+        cache.store("https://example.com", "<html>", {"Cache-Control": "no-store"})
+        assert cache.lookup("https://example.com") == (None, False)
+
+    def test_private_not_stored(self, tmp_path):
+        """Test Cache-Control: private responses are not cached."""
+        cache = ResponseCache(cache_dir=tmp_path)
+        cache.store("https://example.com", "<html>", {"Cache-Control": "private, max-age=60"})
+        assert cache.lookup("https://example.com") == (None, False)
+
+    def test_max_age_overrides_ttl(self, tmp_path):
+        """Test max-age sets freshness instead of the default TTL."""
+        cache = ResponseCache(cache_dir=tmp_path)
+        cache.store("https://example.com", "<html>", {"Cache-Control": "public, max-age=0"})
+        entry, fresh = cache.lookup("https://example.com")
+        assert entry is not None and not fresh
+
+        cache.store("https://example.com", "<html>", {"Cache-Control": "max-age=3600"})
+        cache.ttl_seconds = 0
+        assert cache.lookup("https://example.com")[1]
+
+    def test_no_cache_always_revalidates(self, tmp_path):
+        """Test no-cache entries are stored but never served unrevalidated."""
+        cache = ResponseCache(cache_dir=tmp_path)
+        cache.store("https://example.com", "<html>", {
+            "Cache-Control": "no-cache",
+            "ETag": '"abc"',
+        })
+        entry, fresh = cache.lookup("https://example.com")
+        assert not fresh
+        assert cache.conditional_headers(entry) == {"If-None-Match": '"abc"'}
+
+    def test_expires_relative_to_date(self, tmp_path):
+        """Test Expires gives freshness measured from the Date header."""
+        cache = ResponseCache(cache_dir=tmp_path)
+        cache.store("https://example.com", "<html>", {
+            "Date": "Mon, 01 Jan 2024 00:00:00 GMT",
+            "Expires": "Mon, 01 Jan 2024 01:00:00 GMT",
+        })
+        entry, fresh = cache.lookup("https://example.com")
+        assert fresh and entry["lifetime"] == 3600
+
+        cache.store("https://example.com", "<html>", {"Expires": "0"})
+        assert not cache.lookup("https://example.com")[1]
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    async def test_failures_delay_next_request(self, monkeypatch):
+        """Test backoff from recorded failures applies to the very next acquire."""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(rate_limits.asyncio, "sleep", fake_sleep)
+        limiter = RateLimiter()
+
+        await limiter.acquire("directory", "example.com")
+        assert sleeps == []
+
+        for _ in range(3):
+            limiter.record_failure("example.com")
+        await limiter.acquire("directory", "example.com")
+
+        # 1s initial delay doubled per failure
+        assert len(sleeps) == 1 and sleeps[0] > 7.5
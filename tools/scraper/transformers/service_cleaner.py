@@ -14,9 +14,11 @@ import re
 import os
 import json
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, TYPE_CHECKING
 from pathlib import Path
 
+from ..utils.cache import DiskCache
+
 # Load .env file
 from dotenv import load_dotenv
 load_dotenv()  # Loads from .env in current dir or parent dirs
@@ -28,6 +30,9 @@ try:
 except ImportError:
     HAS_ANTHROPIC = False
 
+if TYPE_CHECKING:
+    from ..enrichers.website_enricher import ExtractedService
+
 
 # Keywords that indicate non-service text
 REJECT_PATTERNS = [
@@ -423,18 +428,89 @@ def deduplicate_services(services: List[Dict[str, Any]]) -> List[Dict[str, Any]]
 # LLM-Assisted Filtering
 # ============================================================================
 
+LLM_FILTER_MODEL = "claude-sonnet-4-20250514"
+# Bump when the filter prompt changes so cached verdicts are not reused
+LLM_FILTER_PROMPT_VERSION = 1
+# Batches sent to the API at once
+LLM_FILTER_CONCURRENCY = 4
+
+
+def _llm_cache_key(category: str, name: str) -> str:
+    """Cache key for a single service-name verdict."""
+    return f"filter:v{LLM_FILTER_PROMPT_VERSION}:{LLM_FILTER_MODEL}:{category.upper()}:{name}"
+
+
+async def _filter_batch_with_llm(
+    client: "anthropic.AsyncAnthropic",
+    batch: List[str],
+    category: str
+) -> Dict[str, bool]:
+    """
+    Send one batch of names to Claude and parse the verdicts.
+
+    Only names the model gave a verdict for are returned, so a truncated
+    reply doesn't yield (and cache) made-up verdicts for the rest.
+    """
+    prompt = f"""You are filtering service names for a {category.lower()} booking platform.
+
+For each service name below, respond with ONLY "valid" or "invalid":
+- "valid" = This is an actual {category.lower()} service that a customer could book (e.g., "Deep Tissue Massage", "Swedish", "Hot Stone Therapy", "Couples Massage", "Reflexology")
+- "invalid" = This is NOT a bookable service - it's one of these:
+  - Marketing copy or taglines ("An Oasis of Relaxation", "Experience True Relaxation")
+  - Business descriptions ("Massages and Rituals", "Spa Services")
+  - Reviews or testimonials
+  - Business names or locations
+  - Credentials or certifications
+  - Benefits descriptions
+  - Incomplete fragments
+  - Website copy or navigation text
+
+Service names to evaluate:
+{chr(10).join(f'{j+1}. {name}' for j, name in enumerate(batch))}
+
+Respond with ONLY a JSON object like: {{"1": "valid", "2": "invalid", ...}}
+No explanations, just the JSON."""
+
+    response = await client.messages.create(
+        model=LLM_FILTER_MODEL,
+        max_tokens=1024,
+        messages=[{"role": "user", "content": prompt}]
+    )
+
+    # Parse response
+    response_text = response.content[0].text.strip()
+    # Extract JSON from response
+    json_match = re.search(r'\{[^}]+\}', response_text)
+    if not json_match:
+        return {}
+
+    batch_results = json.loads(json_match.group())
+    verdicts = {}
+    for j, name in enumerate(batch):
+        verdict = batch_results.get(str(j + 1))
+        if isinstance(verdict, str):
+            verdicts[name] = verdict.lower() == 'valid'
+    return verdicts
+
+
 async def filter_services_with_llm(
     service_names: List[str],
     category: str = "MASSAGE",
-    batch_size: int = 50
+    batch_size: int = 50,
+    max_concurrency: int = LLM_FILTER_CONCURRENCY
 ) -> Dict[str, bool]:
     """
     Use Claude to filter ambiguous service names.
 
+    Verdicts are cached on disk per (prompt version, model, category, name),
+    so re-running on the same providers makes no API calls. Uncached names
+    are split into batches which are sent concurrently.
+
     Args:
         service_names: List of service names to validate
         category: Service category (e.g., "MASSAGE")
         batch_size: Number of services to process per API call
+        max_concurrency: Max API calls in flight at once
 
     Returns:
         Dict mapping service name -> is_valid (True/False)
@@ -448,61 +524,44 @@ async def filter_services_with_llm(
         print("Warning: ANTHROPIC_API_KEY not set, skipping LLM filtering")
         return {name: True for name in service_names}
 
-    client = anthropic.Anthropic(api_key=api_key)
+    cache = DiskCache("llm")
     results = {}
-
-    # Process in batches
-    for i in range(0, len(service_names), batch_size):
-        batch = service_names[i:i + batch_size]
-
-        prompt = f"""You are filtering service names for a {category.lower()} booking platform.
-
-For each service name below, respond with ONLY "valid" or "invalid":
-- "valid" = This is an actual {category.lower()} service that a customer could book (e.g., "Deep Tissue Massage", "Swedish", "Hot Stone Therapy", "Couples Massage", "Reflexology")
-- "invalid" = This is NOT a bookable service - it's one of these:
-  - Marketing copy or taglines ("An Oasis of Relaxation", "Experience True Relaxation")
-  - Business descriptions ("Massages and Rituals", "Spa Services")
-  - Reviews or testimonials
-  - Business names or locations
-  - Credentials or certifications
-  - Benefits descriptions
-  - Incomplete fragments
-  - Website copy or navigation text
-
-Service names to evaluate:
-{chr(10).join(f'{j+1}. {name}' for j, name in enumerate(batch))}
-
-Respond with ONLY a JSON object like: {{"1": "valid", "2": "invalid", ...}}
-No explanations, just the JSON."""
-
-        try:
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            # Parse response
-            response_text = response.content[0].text.strip()
-            # Extract JSON from response
-            json_match = re.search(r'\{[^}]+\}', response_text)
-            if json_match:
-                batch_results = json.loads(json_match.group())
-                for j, name in enumerate(batch):
-                    key = str(j + 1)
-                    is_valid = batch_results.get(key, 'valid').lower() == 'valid'
-                    results[name] = is_valid
+    pending = []
+    for name in service_names:
+        verdict = cache.get(_llm_cache_key(category, name))
+        if verdict is None:
+            pending.append(name)
+        else:
+            results[name] = verdict
+
+    if not pending:
+        return results
+
+    client = anthropic.AsyncAnthropic(api_key=api_key)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(batch: List[str]) -> None:
+        async with semaphore:
+            try:
+                verdicts = await _filter_batch_with_llm(client, batch, category)
+            except Exception as e:
+                print(f"LLM filtering error: {e}")
+                verdicts = {}
+
+        for name in batch:
+            if name in verdicts:
+                results[name] = verdicts[name]
+                cache.set(_llm_cache_key(category, name), verdicts[name])
             else:
-                # If parsing fails, assume all valid
-                for name in batch:
-                    results[name] = True
-
-        except Exception as e:
-            print(f"LLM filtering error: {e}")
-            # On error, assume all valid
-            for name in batch:
+                # No verdict (call failed or reply left it out): assume
+                # valid for this run only, so it's asked again next time
                 results[name] = True
 
+    await asyncio.gather(*(
+        run(pending[i:i + batch_size])
+        for i in range(0, len(pending), batch_size)
+    ))
+
     return results
 
 
@@ -526,10 +585,42 @@ def filter_services_with_llm_sync(
 # Main Cleaning Functions
 # ============================================================================
 
+def clean_extracted_services(
+    services: Iterable["ExtractedService"],
+) -> List["ExtractedService"]:
+    """
+    Apply the per-name rules (steps 1-3) to freshly extracted services.
+
+    Runs before the services are converted to dicts, renaming each kept
+    service in place, so the later provider-level pass can be told the
+    names are already clean (precleaned=True) and skip re-checking them.
+
+    Args:
+        services: ExtractedService objects from a single provider
+
+    Returns:
+        The services that passed, with cleaned names
+    """
+    cleaned = []
+    for service in services:
+        if not is_valid_service(service.name):
+            continue
+
+        cleaned_name = clean_service_name(service.name)
+        if not cleaned_name or len(cleaned_name) < 3:
+            continue
+
+        service.name = cleaned_name
+        cleaned.append(service)
+
+    return cleaned
+
+
 def clean_provider_services(
     provider: Dict[str, Any],
     category: str = "MASSAGE",
-    llm_results: Optional[Dict[str, bool]] = None
+    llm_results: Optional[Dict[str, bool]] = None,
+    precleaned: bool = False
 ) -> Dict[str, Any]:
     """
     Clean all services for a provider according to Section 5 rules.
@@ -538,6 +629,7 @@ def clean_provider_services(
         provider: Provider dict with 'services' list
         category: Service category for universal service name
         llm_results: Optional pre-computed LLM validation results
+        precleaned: Names already went through clean_extracted_services
 
     Returns:
         Provider with cleaned services
@@ -557,16 +649,19 @@ def clean_provider_services(
     for service in services:
         name = service.get('name', '')
 
-        # Skip invalid services (regex-based)
-        if not is_valid_service(name):
-            continue
+        if precleaned:
+            cleaned_name = name
+        else:
+            # Skip invalid services (regex-based)
+            if not is_valid_service(name):
+                continue
 
-        # Clean the name
-        cleaned_name = clean_service_name(name)
+            # Clean the name
+            cleaned_name = clean_service_name(name)
 
-        # Skip if cleaning made it invalid
-        if not cleaned_name or len(cleaned_name) < 3:
-            continue
+            # Skip if cleaning made it invalid
+            if not cleaned_name or len(cleaned_name) < 3:
+                continue
 
         # Skip if LLM said invalid
         if llm_results and not llm_results.get(cleaned_name, True):
@@ -594,7 +689,8 @@ def clean_provider_services(
 async def clean_all_providers_async(
     data: Dict[str, Any],
     category: str = "MASSAGE",
-    use_llm: bool = True
+    use_llm: bool = True,
+    precleaned: bool = False
 ) -> Dict[str, Any]:
     """
     Async version: Clean services for all providers in a dataset.
@@ -603,6 +699,8 @@ async def clean_all_providers_async(
         data: Dict with 'providers' list
         category: Service category
         use_llm: Whether to use LLM for ambiguous filtering
+        precleaned: Every provider's names already went through
+            clean_extracted_services, so steps 1-3 are not re-run
 
     Returns:
         Cleaned data
@@ -616,7 +714,9 @@ async def clean_all_providers_async(
         for provider in providers:
             for service in provider.get('services', []):
                 name = service.get('name', '')
-                if is_valid_service(name):
+                if precleaned:
+                    all_names.add(name)
+                elif is_valid_service(name):
                     cleaned_name = clean_service_name(name)
                     if cleaned_name and len(cleaned_name) >= 3:
                         all_names.add(cleaned_name)
@@ -628,7 +728,7 @@ async def clean_all_providers_async(
             print(f"LLM kept {valid_count}/{len(all_names)} services")
 
     for provider in providers:
-        clean_provider_services(provider, category, llm_results)
+        clean_provider_services(provider, category, llm_results, precleaned)
 
     return data
 
@@ -1,13 +1,18 @@
 """Scraper utility modules."""
 
-from .http import HttpClient, HttpResponse
+from .http import HttpClient, HttpResponse, get_shared_session, close_shared_session
 from .robots import RobotsChecker
 from .hash import content_hash, normalize_url
+from .cache import DiskCache, ResponseCache
 
 __all__ = [
     "HttpClient",
     "HttpResponse",
+    "get_shared_session",
+    "close_shared_session",
     "RobotsChecker",
     "content_hash",
     "normalize_url",
+    "DiskCache",
+    "ResponseCache",
 ]
@@ -0,0 +1,172 @@
+"""
+Disk Cache
+
+File-per-key JSON caches under settings.cache_dir, used to make re-runs
+cheap: HTTP responses are revalidated with ETag / Last-Modified instead of
+re-downloaded, and LLM verdicts are replayed instead of re-requested.
+"""
+
+import hashlib
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+
+from ..config import get_settings
+
+
+class DiskCache:
+    """
+    Persistent key -> JSON-value cache, one file per key.
+
+    Usage:
+        cache = DiskCache("llm")
+        value = cache.get(key)
+        if value is None:
+            value = compute()
+            cache.set(key, value)
+    """
+
+    def __init__(self, namespace: str, cache_dir: Optional[Path] = None):
+        self._dir = (cache_dir or get_settings().cache_dir) / namespace
+
+    def _get_path(self, key: str) -> Path:
+        """Get file path for a cache key."""
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self._dir / digest[:2] / f"{digest}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Load a cached value, or None if missing or unreadable."""
+        try:
+            return orjson.loads(self._get_path(key).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value (must be JSON-serializable)."""
+        path = self._get_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(orjson.dumps(value))
+
+
+def _parse_cache_control(value: str) -> dict[str, Optional[str]]:
+    """Parse a Cache-Control header into lowercase directive -> argument."""
+    directives = {}
+    for part in value.split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') or None
+    return directives
+
+
+def _http_timestamp(value: Optional[str]) -> Optional[float]:
+    """Parse an HTTP date header to a Unix time, or None if invalid."""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _freshness_lifetime(headers) -> Optional[float]:
+    """
+    Seconds a response may be served without revalidation.
+
+    Uses Cache-Control max-age, then Expires (relative to Date). no-cache
+    gives 0, so the entry is always revalidated. None when the server
+    says nothing, leaving it to the cache's default TTL.
+    """
+    directives = _parse_cache_control(headers.get("Cache-Control", ""))
+    if "no-cache" in directives:
+        return 0.0
+
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            return float(max(0, int(max_age)))
+        except ValueError:
+            return 0.0
+
+    expires = headers.get("Expires")
+    if expires is not None:
+        expires_at = _http_timestamp(expires)
+        if expires_at is None:
+            return 0.0  # An invalid Expires means already expired
+        date = _http_timestamp(headers.get("Date")) or time.time()
+        return max(0.0, expires_at - date)
+
+    return None
+
+
+class ResponseCache(DiskCache):
+    """
+    HTTP GET response cache keyed by URL.
+
+    Entries are served without a request while fresh: for the response's
+    Cache-Control max-age or Expires lifetime, or ttl_hours when it gives
+    neither. Stale entries (and no-cache ones, always) are revalidated with
+    If-None-Match / If-Modified-Since, so an unchanged page costs a 304
+    instead of a full download. no-store and private responses are never
+    stored; the cache persists on disk and may be shared.
+    """
+
+    def __init__(self, ttl_hours: int = 24, cache_dir: Optional[Path] = None):
+        super().__init__("http", cache_dir)
+        self.ttl_seconds = ttl_hours * 3600
+
+    def lookup(self, url: str) -> tuple[Optional[dict], bool]:
+        """
+        Look up a cached response.
+
+        Returns:
+            (entry, is_fresh) - entry is None on a miss
+        """
+        entry = self.get(url)
+        if entry is None:
+            return None, False
+        lifetime = entry.get("lifetime")
+        if lifetime is None:
+            lifetime = self.ttl_seconds
+        return entry, time.time() - entry["stored_at"] < lifetime
+
+    @staticmethod
+    def conditional_headers(entry: Optional[dict]) -> dict:
+        """Build revalidation headers for a stale entry."""
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, content: str, headers) -> None:
+        """Store a 200 response unless the server forbids it."""
+        directives = _parse_cache_control(headers.get("Cache-Control", ""))
+        if "no-store" in directives or "private" in directives:
+            return
+        self.set(url, {
+            "content": content,
+            "content_type": headers.get("Content-Type", ""),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "stored_at": time.time(),
+            "lifetime": _freshness_lifetime(headers),
+        })
+
+    def touch(self, url: str, entry: dict, headers=None) -> None:
+        """
+        Mark an entry fresh again after a 304 Not Modified.
+
+        The 304's own caching headers, if any, replace the stored lifetime.
+        """
+        entry["stored_at"] = time.time()
+        if headers is not None:
+            lifetime = _freshness_lifetime(headers)
+            if lifetime is not None:
+                entry["lifetime"] = lifetime
+        self.set(url, entry)
@@ -6,9 +6,39 @@ Tools for content hashing and URL normalization for deduplication.
 
 import hashlib
 import re
+from functools import lru_cache
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
 
 
+# Query parameters dropped by normalize_url
+TRACKING_PARAMS = frozenset({
+    "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
+    "fbclid", "gclid", "ref", "source", "mc_cid", "mc_eid",
+})
+
+# Address words and their abbreviations (matched on lowercased text)
+ADDRESS_ABBREVIATIONS = {
+    "street": "st",
+    "avenue": "ave",
+    "boulevard": "blvd",
+    "drive": "dr",
+    "road": "rd",
+    "lane": "ln",
+    "court": "ct",
+    "place": "pl",
+    "suite": "ste",
+    "apartment": "apt",
+    "north": "n",
+    "south": "s",
+    "east": "e",
+    "west": "w",
+}
+
+_ADDRESS_WORD_RE = re.compile(r"\b(?:" + "|".join(ADDRESS_ABBREVIATIONS) + r")\b")
+_PHONE_STRIP_RE = re.compile(r"[^\d+]")
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+
+
 def content_hash(content: str) -> str:
     """
     Generate SHA-256 hash of content.
@@ -53,14 +83,10 @@ def normalize_url(url: str) -> str:
     path = parsed.path.rstrip("/") or "/"
 
     # Remove common tracking parameters
-    tracking_params = {
-        "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
-        "fbclid", "gclid", "ref", "source", "mc_cid", "mc_eid",
-    }
     query_params = parse_qs(parsed.query)
     filtered_params = {
         k: v for k, v in query_params.items()
-        if k.lower() not in tracking_params
+        if k.lower() not in TRACKING_PARAMS
     }
 
     # Sort and encode query params
@@ -90,7 +116,7 @@ def normalize_phone(phone: str) -> str:
         Normalized phone number (digits only with optional +1 prefix)
     """
     # Remove all non-digit characters except +
-    digits = re.sub(r"[^\d+]", "", phone)
+    digits = _PHONE_STRIP_RE.sub("", phone)
 
     # If it starts with +, keep it; otherwise assume US
     if digits.startswith("+"):
@@ -113,38 +139,23 @@ def normalize_address(address: str) -> str:
     Returns:
         Normalized address
     """
-    # Common abbreviations
-    replacements = {
-        r"\bstreet\b": "st",
-        r"\bavenue\b": "ave",
-        r"\bboulevard\b": "blvd",
-        r"\bdrive\b": "dr",
-        r"\broad\b": "rd",
-        r"\blane\b": "ln",
-        r"\bcourt\b": "ct",
-        r"\bplace\b": "pl",
-        r"\bsuite\b": "ste",
-        r"\bapartment\b": "apt",
-        r"\bnorth\b": "n",
-        r"\bsouth\b": "s",
-        r"\beast\b": "e",
-        r"\bwest\b": "w",
-    }
-
-    normalized = address.lower().strip()
-    for pattern, replacement in replacements.items():
-        normalized = re.sub(pattern, replacement, normalized, flags=re.IGNORECASE)
+    # Common abbreviations, in a single pass
+    normalized = _ADDRESS_WORD_RE.sub(
+        lambda m: ADDRESS_ABBREVIATIONS[m.group()], address.lower()
+    )
 
     # Remove extra whitespace
-    normalized = re.sub(r"\s+", " ", normalized)
-
-    return normalized
+    return " ".join(normalized.split())
 
 
+@lru_cache(maxsize=4096)
 def generate_provider_key(name: str, address: str, city: str) -> str:
     """
     Generate a unique key for provider deduplication.
 
+    Memoized: the deduplicator asks for the same provider's key several
+    times (add, key_for, find_duplicates).
+
     Args:
         name: Provider name
         address: Provider address
@@ -154,7 +165,7 @@ def generate_provider_key(name: str, address: str, city: str) -> str:
         Unique hash key for the provider
     """
     # Normalize components
-    normalized_name = re.sub(r"[^\w\s]", "", name.lower()).strip()
+    normalized_name = _NON_WORD_RE.sub("", name.lower()).strip()
     normalized_address = normalize_address(address)
     normalized_city = city.lower().strip()
 
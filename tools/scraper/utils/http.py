@@ -5,12 +5,23 @@ Async HTTP client with retry logic, timeout handling, and rate limiting integrat
 """
 
 import asyncio
+import time
 from dataclasses import dataclass
 from typing import Optional
 import aiohttp
+import orjson
 from aiohttp import ClientTimeout, ClientError
 
 from ..config import get_settings, RateLimiter
+from .cache import ResponseCache
+
+# Use c-ares for DNS when available, so resolving many hosts in parallel
+# doesn't queue on the getaddrinfo thread pool
+try:
+    import aiodns  # noqa: F401
+    HAS_AIODNS = True
+except ImportError:
+    HAS_AIODNS = False
 
 
 @dataclass
@@ -36,6 +47,65 @@ class HttpResponse:
         return "application/json" in self.content_type.lower()
 
 
+def create_session(timeout: Optional[int] = None) -> aiohttp.ClientSession:
+    """
+    Create a pooled keep-alive session with the scraper's default headers.
+
+    Must be called from inside a running event loop.
+
+    Args:
+        timeout: Total request timeout in seconds (defaults to settings)
+
+    Returns:
+        New aiohttp ClientSession (caller is responsible for closing it)
+    """
+    settings = get_settings()
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=4,
+        ttl_dns_cache=300,
+        # Longer than any rate-limit interval, so a host's connection
+        # survives the wait between its requests
+        keepalive_timeout=300,
+        enable_cleanup_closed=True,
+        resolver=aiohttp.AsyncResolver() if HAS_AIODNS else None,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=ClientTimeout(total=timeout or settings.http_timeout),
+        headers={
+            "User-Agent": settings.user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+        },
+    )
+
+
+_shared_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """
+    Get the process-wide keep-alive session, creating it on first use.
+
+    Sharing one connection pool across sources and enrichers avoids a
+    TCP + TLS handshake for every request to a host we've already hit.
+    Close it with close_shared_session() before the event loop exits.
+    """
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        _shared_session = create_session()
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    """Close the process-wide session if it was created."""
+    global _shared_session
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+
+
 class HttpClient:
     """
     Async HTTP client with retry and rate limiting.
@@ -45,6 +115,10 @@ class HttpClient:
             response = await client.get("https://example.com")
             if response.ok:
                 print(response.content)
+
+    Pass an existing session (e.g. get_shared_session()) to reuse its
+    connection pool; the client will not close a session it didn't create.
+    Pass a ResponseCache to serve repeat GETs from disk.
     """
 
     def __init__(
@@ -52,27 +126,26 @@ class HttpClient:
         rate_limiter: Optional[RateLimiter] = None,
         timeout: Optional[int] = None,
         max_retries: Optional[int] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        cache: Optional[ResponseCache] = None,
     ):
         self.settings = get_settings()
         self.rate_limiter = rate_limiter or RateLimiter()
         self.timeout = timeout or self.settings.http_timeout
         self.max_retries = max_retries or self.settings.http_max_retries
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self.cache = cache
 
     async def __aenter__(self) -> "HttpClient":
-        self._session = aiohttp.ClientSession(
-            timeout=ClientTimeout(total=self.timeout),
-            headers={
-                "User-Agent": self.settings.user_agent,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-            },
-        )
+        if self._owns_session:
+            self._session = create_session(self.timeout)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._session:
+        if self._owns_session and self._session:
             await self._session.close()
+            self._session = None
 
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL."""
@@ -103,6 +176,13 @@ class HttpClient:
         if not self._session:
             raise RuntimeError("HttpClient must be used as async context manager")
 
+        cached = None
+        if self.cache:
+            cached, fresh = self.cache.lookup(url)
+            if fresh:
+                return self._cached_response(url, cached)
+            headers = {**(headers or {}), **self.cache.conditional_headers(cached)}
+
         domain = self._get_domain(url)
         last_error: Optional[Exception] = None
 
@@ -111,12 +191,16 @@ class HttpClient:
                 # Apply rate limiting
                 await self.rate_limiter.acquire(source_type, domain)
 
-                import time
-                start = time.time()
+                start = time.perf_counter()
 
                 async with self._session.get(url, headers=headers) as resp:
+                    if resp.status == 304 and cached:
+                        self.rate_limiter.record_success(domain)
+                        self.cache.touch(url, cached, resp.headers)
+                        return self._cached_response(url, cached)
+
                     content = await resp.text()
-                    elapsed = (time.time() - start) * 1000
+                    elapsed = (time.perf_counter() - start) * 1000
 
                     response = HttpResponse(
                         url=str(resp.url),
@@ -129,6 +213,8 @@ class HttpClient:
 
                     if response.ok:
                         self.rate_limiter.record_success(domain)
+                        if self.cache and resp.status == 200:
+                            self.cache.store(url, content, resp.headers)
                     else:
                         self.rate_limiter.record_failure(domain)
 
@@ -148,6 +234,18 @@ class HttpClient:
 
         raise HttpError(f"Failed to fetch {url} after {self.max_retries} attempts: {last_error}")
 
+    @staticmethod
+    def _cached_response(url: str, entry: dict) -> HttpResponse:
+        """Build a 200 response from a cache entry."""
+        return HttpResponse(
+            url=url,
+            status=200,
+            content=entry["content"],
+            content_type=entry["content_type"],
+            headers={},
+            elapsed_ms=0.0,
+        )
+
     async def get_json(
         self,
         url: str,
@@ -159,8 +257,7 @@ class HttpClient:
         if not response.ok:
             raise HttpError(f"HTTP {response.status} for {url}")
 
-        import json
-        return json.loads(response.content)
+        return orjson.loads(response.content)
 
 
 class HttpError(Exception):
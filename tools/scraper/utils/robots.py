@@ -93,6 +93,7 @@ class RobotsChecker:
     async def _save_to_disk(self, domain: str, content: str) -> None:
         """Save robots.txt content to disk cache."""
         cache_path = self._get_cache_path(domain)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
         cache_path.write_text(content)
 
     async def _fetch_robots(self, url: str) -> Optional[RobotsCacheEntry]:
@@ -0,0 +1,25 @@
+"""
+Runtime Helpers
+
+Shared setup for the scraper's command-line entry points.
+"""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+# uvloop's event loop is faster for many concurrent connections; fall
+# back to asyncio's default loop when it isn't installed (e.g. Windows)
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion like asyncio.run(), on uvloop if available."""
+    if HAS_UVLOOP:
+        return uvloop.run(main)
+    return asyncio.run(main)